@@ -2,10 +2,14 @@
 
 import time
 import re
+from collections import deque
 from typing import Optional, Tuple
 from datetime import datetime
 import os
+import sys
+import traceback
 import pyte
+from wcwidth import wcwidth
 import random
 import string
 from loguru import logger
@@ -17,6 +21,197 @@ from src.state_machines.char_creation_state_machine import CharacterCreationStat
 from src.display.bot_unified_display import UnifiedBotDisplay
 from src.decision_engine import DecisionEngine, DecisionContext, create_default_engine
 from src.tui_parser import DCSSLayoutParser
+from src.utils.file_writer import BackgroundFileWriter
+from src.utils.clock import timestamp_ms
+
+
+# ANSI escape sequences: CSI (ESC [ params/intermediates final) and charset selection (ESC ( X).
+# Uses the actual CSI byte grammar so the engine scans linearly without backtracking.
+_ANSI_RE = re.compile(r'\x1b\[[\x20-\x3f]*[\x40-\x7e]|\x1b\([B0UK]')
+
+# Exploration event messages, scanned in one pass; m.lastgroup names the event kind
+_EVENT_RE = re.compile(
+    r'(?P<gold>Found (?P<gold_n>\d+) gold pieces?)'
+    r'|(?P<see>You see (?P<see_item>.+?)\.)'
+    r'|(?P<here>There is (?P<here_item>.+?) here)'
+    r'|(?P<enc>You encounter (?P<enc_who>.+?)[.,])'
+    r'|(?P<feat>open door|closed door|stone staircase|metal grate)'
+)
+# Literal text every _EVENT_RE alternative starts with or contains; screens without any skip the scan
+_EVENT_TRIGGERS = ('Found ', 'You see ', 'There is ', 'You encounter ', 'door', 'stone staircase', 'metal grate')
+# Upper-case log labels for the event types _detect_exploration_events records
+_EVENT_LABELS = {event_type: event_type.upper() for event_type in ('gold', 'item', 'enemy', 'feature')}
+_FEATURE_TYPES = (
+    ('open door', 'door'),
+    ('closed door', 'door'),
+    ('stone staircase', 'stairs'),
+    ('metal grate', 'grate'),
+)
+# Character creation menu phrases by menu type, in detection priority order
+_MENU_PHRASES = (
+    ('race', ('select your species', 'select your ancestry', 'please select your species',
+              'choose your race', 'choose your species', 'species:', 'ancestry:',
+              'which species', 'which ancestry', 'which race')),
+    ('class', ('select your class', 'please select your class',
+               'choose your class', 'job:', 'profession:', 'which class',
+               'which job', 'choose your job')),
+    ('weapons', ('choice of weapons', 'choice of melee weapons', 'choice of ranged weapons',
+                 'weapon choice')),
+    ('background', ('select your background', 'please select your background',
+                    'background:', 'background -', 'choose background',
+                    'religious choice')),
+    ('skills', ('skill aptitudes', 'skill -', 'skill points', 'choose skills',
+                'select your skills')),
+    ('difficulty', ('difficulty', 'challenge', 'permadeath', 'hardcore',
+                    'select your difficulty')),
+    ('abilities', ('ability', 'ability -', 'abil:', 'ability scores',
+                   'select your ability')),
+)
+# Menu choices in preference order: (option on screen or None for the fallback, key, log message).
+# Character preferences: Race: Gnoll, Class: Fighter, Weapon: War Axe
+_MENU_CHOICES = {
+    'race': (('gnoll', 'g', "Menu: Choosing Gnoll (g)"),
+             ('human', 'h', "Menu: Choosing Human (h) - Gnoll not available"),
+             (None, 'a', "Menu: Choosing first race option (a)")),
+    'class': (('fighter', 'f', "Menu: Choosing Fighter (f)"),
+              (None, 'a', "Menu: Choosing first class option (a)")),
+    'background': ((None, 'a', "Menu: Choosing default option for background (a)"),),
+    'weapons': (('war axe', 'w', "Menu: Choosing War Axe (w)"),
+                ('axe', 'a', "Menu: Choosing Axe (a)"),
+                (None, 'a', "Menu: Choosing first weapon option (a)")),
+    'skills': ((None, 'a', "Menu: Choosing default option for skills (a)"),),
+    'abilities': ((None, 'a', "Menu: Choosing default option for abilities (a)"),),
+    'difficulty': ((None, 'a', "Menu: Choosing default option for difficulty (a)"),),
+}
+
+# Missile words _detect_items_on_ground skips when they appear in item messages
+_MISSILE_WORDS = ('stone', 'arrow', 'bolt', 'dart', 'javelin', 'sling bullet')
+# Message-log phrases that make the layout parse in _detect_items_on_ground worthwhile
+_GROUND_MESSAGE_RE = re.compile(r'you see here|there are no items here', re.IGNORECASE)
+
+# Inventory entry lines ("a - item", " b) item"): letter, dash or paren, whitespace, then text,
+# allowing surrounding whitespace on the line (same as matching each stripped line)
+_INVENTORY_LINE_RE = re.compile(r'(?m)^[^\S\n]*[a-z][^\S\n]*[-)][^\S\n]+\S')
+
+# Game-vs-menu guard: map glyphs next to the player, and stat-panel markers
+_MAP_CHARS = frozenset('#+. ')
+_GAME_MARKERS = ('exp:', 'ac:', 'hp:', '@')
+
+# Creature words that mark an encounter message as an enemy; matched as substrings of the
+# lowered name, so compound names like 'hobgoblin' or 'dragonfly' count too
+_CREATURE_WORDS = (
+    'rat', 'bat', 'spider', 'goblin', 'kobold', 'orc', 'troll',
+    'endoplasm', 'slug', 'newt', 'iguana', 'ape', 'giant',
+    'ogre', 'dragon', 'demon', 'ghost', 'mummy',
+)
+
+# Common potion effect messages (lower case), checked in order by _parse_potion_effect_from_message
+_POTION_EFFECTS = {
+    'healing': ('you feel much better', 'you are healed', 'wounds are healed', 'recover'),
+    'cure poison': ('poison is cured', 'lose the poison', 'no longer poisoned'),
+    'might': ('you feel strong', 'you feel invigorated', 'feel mighty'),
+    'magic': ('glow briefly', 'feel more magical', 'magic improves'),
+    'agility': ('feel quick', 'feel nimble', 'faster'),
+    'resistance': ('feel resistant', 'protected from elements', 'more resilient'),
+    'levitation': ('you float', 'you ascend', 'lose your footing'),
+    'flight': ('you fly', 'grow wings', 'soar'),
+}
+
+# Lower-case screen phrases and map glyphs _has_existing_character uses to tell a loaded game from creation menus
+_GAME_INTERFACE_PHRASES = (
+    'welcome back',
+    'welcome to',
+    'press ? for a list of commands',
+    'health:',  # Character stats
+    'magic:',
+    ' ac:',      # Note the space before AC to avoid 'place'
+    ' xp:',
+    ' ev:',
+    'dungeon:',
+    'dungeon level',
+    'exp:',
+)
+_DUNGEON_GLYPHS = ('#', '.', '+', '-', '|')
+_CREATION_MENU_PHRASES = (
+    'choose a race',
+    'choose a class',
+    'choose your',
+    'enter a character name',
+    'choose a background',
+    'choose your abilities',
+)
+
+# Lower-case words that mark the end-of-game screens as back at character selection or the main menu
+_END_SCREEN_WORDS = ('character', 'select', 'welcome to', 'not logged in')
+
+# Debug screenshot labels for each character creation menu state in _local_startup
+_MENU_SCREENSHOTS = {
+    'race': 'CHARACTER CREATION: Species Selection',
+    'class_select': 'CHARACTER CREATION: Class Selection',
+    'background': 'CHARACTER CREATION: Background Selection',
+    'skills': 'CHARACTER CREATION: Skills/Equipment Selection',
+}
+
+# Key and choice name sent for each character creation menu state in _local_startup
+_SELECTION_MAP = {
+    'species': ('j', 'Human'),           # j = Human
+    'class_select': ('a', 'Fighter'),  # a = Fighter (for background)
+    'background': ('a', 'Fighter'),    # a = Fighter
+    'skills': ('c', 'War Axe'),        # c = War Axe (weapon selection)
+}
+
+# DCSS movement keys for one step (dx, dy), indexed by (dy + 1) * 3 + dx + 1;
+# '.' (wait) when already on top of the target
+_DIRECTION_KEYS = (
+    'y', 'k', 'u',  # up-left, up, up-right
+    'h', '.', 'l',  # left, wait, right
+    'b', 'j', 'n',  # down-left, down, down-right
+)
+
+# Monsters section entries: grouped "gg  2 goblins" (symbols, count, name) and
+# standard "K   kobold" (symbol, 3+ spaces, name up to the next entry, status or border)
+_GROUPED_MONSTER_RE = re.compile(r'([a-zA-Z]{2,})\s+(\d+)\s+(\w+)')
+_STANDARD_MONSTER_RE = re.compile(r'([a-zA-Z])\s{3,}([\w\s]+?)(?=\s{3,}[a-zA-Z]|\(|[│]|$)')
+# Grouped entries need a count, so lines without a digit skip the grouped pattern
+_DIGIT_RE = re.compile(r'\d')
+# Grouped-entry "symbols" that are really words from messages, e.g. "Found 19 sling",
+# "You have 9 gold" or "Nothing quivered"
+_NON_MONSTER_WORDS = frozenset({
+    'Found', 'You', 'The', 'This', 'That', 'Your', 'And', 'Are', 'But', 'Can', 'For', 'Have', 'Here',
+    'Just', 'Know', 'Like', 'Make', 'More', 'Now', 'Only', 'Out', 'Over', 'Some', 'Such', 'Take', 'Want',
+    'Way', 'What', 'When', 'Will', 'With', 'Would', 'have', 'here', 'Nothing',
+})
+# Item and equipment-status words that rule out a grouped entry's name (substring match, lower case)
+_NON_MONSTER_ITEM_WORDS = (
+    'arrow', 'dart', 'potion', 'scroll', 'ring', 'amulet', 'wand', 'staff', 'weapon', 'armour', 'armor',
+    'item', 'stone', 'food', 'poisoned', 'cursed', 'blessed', 'quivered',
+)
+# Stats panel labels and stray letters that the monster patterns can pick up as names
+_STAT_PANEL_NAMES = frozenset({
+    'place', 'noise', 'time', 'ac', 'ev', 'sh', 'xl', 'next', 'magic', 'health', 'str', 'int', 'dex', 'a', 'o', 'b',
+})
+# Map glyphs that never appear in a creature name
+_MAP_GLYPHS_IN_NAME = frozenset('#.+=~,|-')
+
+# A monsters section row starting at the line start: symbol, then 3+ spaces before the name
+_MONSTER_ROW_SYMBOL_RE = re.compile(r'([a-zA-Z])\s{3,}')
+
+# Combat words reported by the no-response diagnostics in the wait branch
+_COMBAT_HINT_RE = re.compile(r'You encounter|block|miss|hits|damage|rat|bat')
+
+
+def _strip_ansi(text: str) -> str:
+    """
+    Remove ANSI escape sequences from text (stateless, safe on any thread).
+    
+    Removes color/style codes (ESC[...m), cursor movement (ESC[...H, ESC[...d, etc)
+    and character set selection (ESC(B, etc). Every alternative of _ANSI_RE starts
+    with ESC, so the regex engine already jumps between ESC bytes with a fast literal
+    search; a Python-level find()/match() loop measured about 4x slower on real screens.
+    """
+    if '\x1b' not in text:
+        return text
+    return _ANSI_RE.sub('', text)
 
 
 class ScreenBuffer:
@@ -31,12 +226,22 @@ class ScreenBuffer:
     All game logic should use get_screen_text() to read the complete reconstructed state.
     """
     
+    # Fixed attribute set: the buffer is hit on every PTY chunk, so skip the per-instance dict
+    __slots__ = ('width', 'height', 'screen', 'stream', '_line_cache', '_joined', '_message_log', 'version')
+    
     def __init__(self, width: int = 160, height: int = 40):
         """Initialize screen buffer with pyte terminal emulator."""
         self.width = width
         self.height = height
         self.screen = pyte.Screen(width, height)
         self.stream = pyte.Stream(self.screen)
+        # Rendered (rstripped) rows, refreshed only for lines pyte marks dirty
+        self._line_cache = [""] * height
+        self._joined: Optional[str] = None
+        self._message_log: Optional[str] = None
+        # Bumped whenever the visible content may have changed
+        self.version = 0
+        self._refresh_dirty_lines()
     
     def update_from_output(self, output: str) -> None:
         """
@@ -49,21 +254,86 @@ class ScreenBuffer:
             self.stream.feed(output)
         except Exception as e:
             logger.debug(f"pyte parsing error: {e}")
+        self._refresh_dirty_lines()
+    
+    def _refresh_dirty_lines(self) -> None:
+        """
+        Re-render only the rows pyte marked dirty since the last refresh.
+        
+        The version is bumped only when a row's text actually changed, so repainting
+        identical text (common in curses redraws) keeps the screen "unchanged".
+        """
+        dirty = self.screen.dirty
+        if not dirty:
+            return
+        height = self.height
+        line_cache = self._line_cache
+        render_line = self._render_line
+        changed = False
+        for y in dirty:
+            if 0 <= y < height:
+                text = render_line(y)
+                if text != line_cache[y]:
+                    line_cache[y] = text
+                    changed = True
+        dirty.clear()
+        if changed:
+            self._joined = None
+            self._message_log = None
+            self.version += 1
+    
+    def _render_line(self, y: int) -> str:
+        """Render one screen row the same way pyte.Screen.display does, without trailing spaces."""
+        line = self.screen.buffer[y]
+        text = ''.join(line[x].data for x in range(self.width))
+        if not text.isascii():
+            # Wide characters occupy two cells; pyte leaves a stub cell after them that display skips
+            chars = []
+            is_wide_char = False
+            for x in range(self.width):
+                if is_wide_char:
+                    is_wide_char = False
+                    continue
+                char = line[x].data
+                is_wide_char = bool(char) and wcwidth(char[0]) == 2
+                chars.append(char)
+            text = ''.join(chars)
+        return text.rstrip()
     
     def get_screen_text(self) -> str:
         """Get the current screen as text."""
-        lines = []
-        for line in self.screen.display:
-            # Remove trailing spaces from each line
-            lines.append(line.rstrip())
-        # Remove trailing empty lines
-        while lines and not lines[-1]:
-            lines.pop()
-        return '\n'.join(lines)
+        if self._joined is None:
+            lines = list(self._line_cache)
+            # Remove trailing empty lines
+            while lines and not lines[-1]:
+                lines.pop()
+            self._joined = '\n'.join(lines)
+        return self._joined
+    
+    def get_message_log_text(self) -> str:
+        """
+        Get the message log rows as text, without a full layout parse.
+        
+        Rows are picked the same way DCSSLayoutParser does: rows starting with '_'
+        and non-blank rows below row 20. Cached until the buffer changes.
+        """
+        if self._message_log is None:
+            self._message_log = '\n'.join(
+                line for y, line in enumerate(self._line_cache)
+                if line.startswith('_') or (y > 20 and line.strip())
+            )
+        return self._message_log
 
 
 class DCSSBot:
     """Main bot for playing Dungeon Crawl Stone Soup."""
+    
+    # Screen index entries buffered before the index file is flushed
+    INDEX_FLUSH_INTERVAL = 50
+    # Most recent exploration events kept in memory (older ones only survive in the counts)
+    EXPLORATION_EVENT_LIMIT = 5000
+    # Pending background writer jobs before debug screen captures are dropped
+    DEBUG_QUEUE_SIZE = 64
 
     def __init__(self, crawl_command: str = None):
         """
@@ -89,8 +359,34 @@ class DCSSBot:
         # Screen buffer for caching complete screen state
         self.screen_buffer = ScreenBuffer()
         
+        # TUI layout parser, with its result cached per screen buffer version
+        self._tui_parser = DCSSLayoutParser()
+        self._tui_cache_version = None
+        self._tui_cache_areas = {}
+        
+        # One-slot cache for _clean_ansi (same screen is cleaned by several helpers per tick)
+        self._ansi_cache_raw = None
+        self._ansi_cache_clean = ""
+        # Lower-cased clean screen shared by the decision helpers (see _lower_clean)
+        self._lower_clean_for = None
+        self._lower_clean_text = ""
+        # Cleaned copy of last_screen, kept apart so cleaning other text never evicts it
+        self._last_screen_cleaned_for = None
+        self._last_screen_cleaned = ""
+        # Enemy scan of the last decision screen (see _scan_enemies)
+        self._enemy_scan_for = None
+        self._enemy_scan = (False, "", None)
+        # Cleaned lines and monsters-section enemies of the last screen scanned (see _clean_lines)
+        self._clean_lines_for = None
+        self._clean_lines_list = []
+        self._tui_enemies_for = None
+        self._tui_enemies = []
+        self._tui_monsters = []
+        
         # Unified display (game screen + activity panel)
         self.unified_display = UnifiedBotDisplay()
+        self._last_display_key: Optional[tuple] = None  # Inputs of the last frame drawn
+        self._last_visual_frame: Optional[str] = None  # Last frame drawn by _display_screen_visual
         
         # Track consecutive rest actions to prevent infinite resting
         self.consecutive_rest_actions = 0
@@ -130,17 +426,27 @@ class DCSSBot:
         self.unchanged_screen_count = 0
         self.max_unchanged_screens = 5  # Error if screen doesn't change 5 times in a row
         
+        # Rolling average of how long the game takes to answer a command (drives the read settle time)
+        self.avg_response_ms = 600.0
+        # Screen text object last parsed into game state (see _parse_output)
+        self._parsed_output = None
+        # Screen buffer version last checked for events and game over in the main loop (-1 = never)
+        self._checked_screen_version = -1
+        # Message log text last scanned for exploration events
+        self._last_event_text = None
+        
         # Event tracking for exploration log
-        self.exploration_events = []  # List of (move_count, event_type, description)
+        self.exploration_events = deque(maxlen=self.EXPLORATION_EVENT_LIMIT)  # Recent (move_count, event_type, description)
+        self.event_counts = {}  # event_type -> number of events over the whole session
         self.gold_found = 0
-        self.items_found = []
+        self.items_found = []  # In discovery order, for the final report
+        self._items_found_set = set()  # Same items, for O(1) duplicate checks
         self.enemies_encountered = set()
         self.level_ups_gained = []
         self.last_level_up_processed = 0  # Track last level we processed level-up for (avoid re-detecting same message)
         self.last_attribute_increase_level = 0  # Track level we processed attribute increase for (avoid re-prompting)
         
         # Inventory and item tracking
-        self.quaff_slot = None  # Current slot being quaffed (set by _identify_untested_potions)
         self.last_items_on_ground_check = 0  # Move count when we last checked for items
         self.last_grab_attempt = 0  # Move count when we last tried to grab items
         self.last_grab_failed = False  # Whether the last grab attempt found nothing
@@ -150,7 +456,6 @@ class DCSSBot:
         self.in_item_pickup_menu = False  # Whether we're in the "Pick up what?" menu
         
         # Equipment management
-        self.equip_slot = None  # Current slot being equipped (set by _find_and_equip_better_armor)
         self.last_equipment_check = 0  # Move count when we last checked for equipment upgrades
         
         # Initialize decision engine (Phase 3 refactor: replaces 1200-line _decide_action method)
@@ -182,6 +487,8 @@ class DCSSBot:
         os.makedirs(self.debug_screens_dir, exist_ok=True)
         self.screen_counter = 0
         self.screen_index_file = os.path.join(self.debug_screens_dir, "index.txt")
+        # Bounded so a slow disk drops debug captures instead of growing memory without limit
+        self.debug_writer = BackgroundFileWriter(maxsize=self.DEBUG_QUEUE_SIZE)
         
         # Write header to log file
         with open(self.log_file, 'w') as f:
@@ -196,14 +503,119 @@ class DCSSBot:
             f.write("=== Screen Interactions Index ===\n")
             f.write(f"Session started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("=" * 80 + "\n\n")
+        
+        # Keep both files open for the session instead of reopening them every move.
+        # The session log is shared with loguru, so it is flushed after each entry;
+        # the index is only written by us and is flushed every INDEX_FLUSH_INTERVAL entries.
+        # run() closes both in its finally block.
+        self._log_fp = open(self.log_file, 'a', buffering=1 << 16)
+        self._index_fp = open(self.screen_index_file, 'a', buffering=1 << 16)
+        self._index_entries_since_flush = 0
 
     def _clean_ansi(self, text: str) -> str:
-        """Remove ANSI escape sequences from text."""
-        # Remove all ANSI escape sequences including:
-        # - Color/style codes: \x1b[...m
-        # - Cursor movement: \x1b[...H, \x1b[...d, etc
-        # - Character set selection: \x1b(B, etc
-        return re.sub(r'\x1b\[[^\x1b]*?[a-zA-Z]|\x1b\([B0UK]', '', text)
+        """
+        Remove ANSI escape sequences from text.
+        
+        The last input/result pair is cached, so repeated cleaning of the same
+        screen within one tick costs a string comparison instead of a regex pass.
+        """
+        if text == self._ansi_cache_raw:
+            return self._ansi_cache_clean
+        # Text rendered by the screen buffer has no escapes at all; skip the regex pass
+        if '\x1b' not in text:
+            return text
+        clean = _strip_ansi(text)
+        self._ansi_cache_raw = text
+        self._ansi_cache_clean = clean
+        return clean
+
+    def _lower_clean(self, output: str) -> str:
+        """
+        Return output with ANSI codes removed and lower-cased, computed once per screen.
+        
+        The decision helpers all receive the same screen object each move, so the result
+        is cached on the identity of output and shared between them.
+        """
+        if output is not self._lower_clean_for:
+            self._lower_clean_for = output
+            self._lower_clean_text = self._clean_ansi(output).lower() if output else ""
+        return self._lower_clean_text
+
+    def _clean_lines(self, output: str) -> list[str]:
+        """
+        Return output with ANSI codes removed, split into lines, once per screen.
+        
+        The enemy helpers each walk the same screen line by line; the split is cached
+        on the identity of output and shared between them. Callers must not modify it.
+        """
+        if output is not self._clean_lines_for:
+            self._clean_lines_for = output
+            self._clean_lines_list = self._clean_ansi(output).split('\n')
+        return self._clean_lines_list
+
+    def _scan_enemies(self, output: str) -> Tuple[bool, str, Optional[str]]:
+        """
+        Detect the enemy in range and the direction towards it, once per screen.
+        
+        Both only depend on the screen text, and the decision screen is the memoized
+        buffer text, so an unchanged screen is the same object and reuses the result.
+        
+        Returns:
+            Tuple of (enemy_detected, enemy_name, enemy_direction)
+        """
+        if output is not self._enemy_scan_for:
+            enemy_detected, enemy_name = self._detect_enemy_in_range(output)
+            enemy_direction = None
+            if enemy_detected:
+                # Calculate direction to move toward the enemy when low health
+                enemy_direction = self._calculate_direction_to_enemy(output, enemy_name)
+            self._enemy_scan_for = output
+            self._enemy_scan = (enemy_detected, enemy_name, enemy_direction)
+        return self._enemy_scan
+
+    def _clean_last_screen(self) -> str:
+        """
+        Return self.last_screen with ANSI codes removed, cleaning each new screen only once.
+        
+        The main loop and its error diagnostics read the cleaned last screen several times
+        per move; the cache is keyed on the identity of the last_screen string.
+        """
+        screen = self.last_screen
+        if screen is not self._last_screen_cleaned_for:
+            self._last_screen_cleaned_for = screen
+            self._last_screen_cleaned = _strip_ansi(screen) if screen else ""
+        return self._last_screen_cleaned
+
+    def _parse_screen_buffer(self) -> str:
+        """
+        Parse game state from the screen buffer, at most once per buffer change.
+        
+        The reconstructed buffer is the single source of truth for game state; raw
+        PTY responses are deltas and are only fed into the buffer, never parsed directly.
+        
+        Returns:
+            The current screen buffer text
+        """
+        # get_screen_text returns the same string object until the buffer changes
+        buffer_text = self.screen_buffer.get_screen_text()
+        self._parse_output(buffer_text)
+        return buffer_text
+
+    def _parse_output(self, output: str) -> None:
+        """
+        Parse screen text into game state, skipping text that was just parsed.
+        
+        Parsing is deterministic in the text, so handing the parser the same string
+        object twice in a row (the main loop parses the buffer, then builds the
+        decision context from that same string) changes nothing. The check is on
+        identity rather than a hash, which would cost a full pass over each new screen.
+        
+        Args:
+            output: Screen text, raw or from the screen buffer
+        """
+        if output is not self._parsed_output:
+            self._parsed_output = output
+            self.parser.parse_output(output)
 
     def _generate_random_name(self, length: int = None) -> str:
         """Generate a random character name (6-8 characters by default)."""
@@ -221,7 +633,9 @@ class DCSSBot:
         """
         event = (self.move_count, event_type, description)
         self.exploration_events.append(event)
-        logger.info(f"[Event] Move #{self.move_count}: [{event_type.upper()}] {description}")
+        self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
+        label = _EVENT_LABELS.get(event_type) or event_type.upper()
+        logger.info(f"[Event] Move #{self.move_count}: [{label}] {description}")
 
     def _detect_exploration_events(self, output: str) -> None:
         """
@@ -241,78 +655,87 @@ class DCSSBot:
         
         clean_output = self._clean_ansi(output)
         
+        # Single scan: keep the first match of each event kind, then handle kinds in priority order.
+        # Most screens contain no trigger text at all, and a few substring checks are far cheaper
+        # than the regex scan (the level-up check below still runs either way).
+        first = {}
+        features = set()
+        if any(trigger in clean_output for trigger in _EVENT_TRIGGERS):
+            for m in _EVENT_RE.finditer(clean_output):
+                kind = m.lastgroup
+                if kind == 'feat':
+                    features.add(m.group('feat'))
+                elif kind not in first:
+                    first[kind] = m
+        
         # Gold detection
-        gold_match = re.search(r'Found (\d+) gold pieces?', clean_output)
+        gold_match = first.get('gold')
         if gold_match:
-            amount = int(gold_match.group(1))
+            amount = int(gold_match.group('gold_n'))
             self.gold_found += amount
             self._log_event('gold', f"Found {amount} gold pieces")
             return  # Process one event per screen
         
         # Item detection
-        item_patterns = [
-            (r'You see (.+?)\.', 'discovered'),
-            (r'There is (.+?) here', 'found'),
-        ]
-        for pattern, event_type in item_patterns:
-            item_match = re.search(pattern, clean_output)
+        for kind, group, label in (('see', 'see_item', 'Discovered'), ('here', 'here_item', 'Found')):
+            item_match = first.get(kind)
             if item_match:
-                item = item_match.group(1)
-                if item not in self.items_found:
+                item = item_match.group(group)
+                if item not in self._items_found_set:
+                    self._items_found_set.add(item)
                     self.items_found.append(item)
-                    self._log_event('item', f"{event_type.title()}: {item}")
+                    self._log_event('item', f"{label}: {item}")
                 return
         
         # Enemy encounter detection
-        enemy_patterns = [
-            r'You encounter (.+?)(?:\.|,)',
-            r'There is (.+?) here',
-        ]
-        for pattern in enemy_patterns:
-            enemy_match = re.search(pattern, clean_output)
-            if enemy_match:
-                enemy = enemy_match.group(1).strip()
-                # Filter out items and focus on creatures
-                if any(creature in enemy.lower() for creature in [
-                    'rat', 'bat', 'spider', 'goblin', 'kobold', 'orc', 'troll',
-                    'endoplasm', 'slug', 'newt', 'iguana', 'ape', 'giant',
-                    'ogre', 'dragon', 'demon', 'ghost', 'mummy'
-                ]):
-                    if enemy not in self.enemies_encountered:
-                        self.enemies_encountered.add(enemy)
-                        self._log_event('enemy', f"Encountered: {enemy}")
-                    return
+        enemy_match = first.get('enc')
+        if enemy_match:
+            enemy = enemy_match.group('enc_who').strip()
+            # Filter out items and focus on creatures
+            enemy_lower = enemy.lower()
+            if any(creature in enemy_lower for creature in _CREATURE_WORDS):
+                if enemy not in self.enemies_encountered:
+                    self.enemies_encountered.add(enemy)
+                    self._log_event('enemy', f"Encountered: {enemy}")
+                return
         
         # Level-up detection (already logged separately, but add to events too)
-        # Use TUI parser to extract message log section for reliability
+        # Read the message log section of the screen buffer for reliability
         screen_text = self.screen_buffer.get_screen_text() if self.last_screen else ""
-        if screen_text:
-            tui_parser = DCSSLayoutParser()
-            tui_areas = tui_parser.parse_layout(screen_text)
-            message_log_area = tui_areas.get('message_log', None)
-            if message_log_area:
-                message_content = message_log_area.get_text()
-                if 'You have reached level' in message_content:
-                    level_match = re.search(r'You have reached level (\d+)', message_content)
-                    if level_match:
-                        level = int(level_match.group(1))
-                        if level not in self.level_ups_gained:
-                            self.level_ups_gained.append(level)
-                            # Note: This will be logged by the main level-up detection too
-                    return
+        # The message log is a subset of the screen, so skip extracting it when the phrase is absent
+        if screen_text and 'You have reached level' in screen_text:
+            message_content = self.screen_buffer.get_message_log_text()
+            if 'You have reached level' in message_content:
+                level_match = re.search(r'You have reached level (\d+)', message_content)
+                if level_match:
+                    level = int(level_match.group(1))
+                    if level not in self.level_ups_gained:
+                        self.level_ups_gained.append(level)
+                        # Note: This will be logged by the main level-up detection too
+                return
         
         # Door/Feature discovery
-        feature_patterns = [
-            (r'open door', 'door'),
-            (r'closed door', 'door'),
-            (r'stone staircase', 'stairs'),
-            (r'metal grate', 'grate'),
-        ]
-        for pattern, feature_type in feature_patterns:
-            if pattern in clean_output:
+        for pattern, feature_type in _FEATURE_TYPES:
+            if pattern in features:
                 self._log_event('feature', f"Found {feature_type}")
                 return
 
+    def _get_tui_areas(self) -> dict:
+        """
+        Get the TUI layout areas for the current screen buffer contents.
+        
+        The layout is only re-parsed when the screen buffer version changes,
+        so several detectors can inspect the same screen for one parse.
+        
+        Returns:
+            Dict of area name -> TUIArea, as returned by DCSSLayoutParser.parse_layout
+        """
+        version = self.screen_buffer.version
+        if self._tui_cache_version != version:
+            self._tui_cache_areas = self._tui_parser.parse_layout(self.screen_buffer.get_screen_text())
+            self._tui_cache_version = version
+        return self._tui_cache_areas
+
     def _get_screen_capture(self) -> str:
         """
         Get the full visible PTY screen from accumulated PTY output.
@@ -325,13 +748,12 @@ class DCSSBot:
             visual = self.screen_buffer.get_screen_text()
             
             # If buffer is mostly empty, fall back to showing cleaned last_screen
-            if not visual.strip():
-                return self._clean_ansi(self.last_screen) if self.last_screen else "(empty)"
+            if not visual or visual.isspace():
+                return self._clean_last_screen() if self.last_screen else "(empty)"
             
             return visual
         except Exception as e:
             logger.error(f"Failed to get screen capture: {e}")
-            import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             return f"(Screen capture error: {e})"
 
@@ -347,37 +769,31 @@ class DCSSBot:
         """
         try:
             # Get the FULL accumulated visual screen state from the pyte buffer
+            # (memoized by the buffer until new output arrives)
             visual_screen = self.screen_buffer.get_screen_text()
             
-            if not visual_screen or not visual_screen.strip():
+            if not visual_screen or visual_screen.isspace():
                 logger.debug("No visual screen available to display")
                 return
             
-            # Build status/health info
+            # Build status/health info: every present field ends in " | ", trimmed once at the end
             state = self.parser.state
-            status_parts = []
             
             # Only display health if we've actually parsed it from the game screen
             # (i.e., the screen contains "Health:" or "HP:" text indicating we're in gameplay)
-            if 'Health:' in visual_screen or 'HP:' in visual_screen:
-                if state.health > 0 or state.max_health > 0:
-                    status_parts.append(f"Health: {state.health}/{state.max_health}")
-                if state.mana > 0 or state.max_mana > 0:
-                    status_parts.append(f"Mana: {state.mana}/{state.max_mana}")
-            
-            # Display level and dungeon depth if available
-            if state.experience_level > 0:
-                status_parts.append(f"Level: {state.experience_level}")
-            if state.dungeon_level > 0:
-                status_parts.append(f"Depth: {state.dungeon_branch}:{state.dungeon_level}")
-            
-            # Display step progress
-            if self.max_steps > 0:
-                status_parts.append(f"Steps: {self.move_count}/{self.max_steps}")
-            elif self.move_count > 0:
-                status_parts.append(f"Steps: {self.move_count}")
-            
-            health_info = " | ".join(status_parts)
+            shows_health = 'Health:' in visual_screen or 'HP:' in visual_screen
+            health_info = (
+                (f"Health: {state.health}/{state.max_health} | "
+                 if shows_health and (state.health > 0 or state.max_health > 0) else "")
+                + (f"Mana: {state.mana}/{state.max_mana} | "
+                   if shows_health and (state.mana > 0 or state.max_mana > 0) else "")
+                # Level and dungeon depth if available
+                + (f"Level: {state.experience_level} | " if state.experience_level > 0 else "")
+                + (f"Depth: {state.dungeon_branch}:{state.dungeon_level} | " if state.dungeon_level > 0 else "")
+                # Step progress
+                + (f"Steps: {self.move_count}/{self.max_steps} | " if self.max_steps > 0
+                   else f"Steps: {self.move_count} | " if self.move_count > 0 else "")
+            )[:-3]
             
             # Get current state - handle both state machine types
             try:
@@ -386,11 +802,19 @@ class DCSSBot:
             except (AttributeError, TypeError):
                 current_state = "UNKNOWN"
             
+            # Skip the redraw when nothing visible has changed since the last frame
+            shown_action = action or self.last_action
+            display_key = (self.screen_buffer.version, self.move_count, shown_action,
+                           current_state, health_info, self.unified_display.activity_version)
+            if display_key == self._last_display_key:
+                return
+            self._last_display_key = display_key
+            
             # Display using unified display
             self.unified_display.display(
                 visual_screen=visual_screen,
                 move_count=self.move_count,
-                action=action or self.last_action,
+                action=shown_action,
                 state=current_state,
                 health=health_info
             )
@@ -398,6 +822,29 @@ class DCSSBot:
         except Exception as e:
             logger.debug(f"Error displaying TUI: {e}")
     
+    def _read_response(self, timeout: float = 3.5) -> str:
+        """
+        Read the game's response to a command, returning as soon as the output settles.
+        
+        The settle time (no new data for this long means the screen is complete) is half the
+        rolling average response latency, clamped to 0.1-0.3s, so a responsive game is not
+        held to a fixed delay per move.
+        
+        Args:
+            timeout: Maximum time to wait for a response in seconds
+            
+        Returns:
+            The response output, or "" if nothing arrived within timeout
+        """
+        stability_threshold = max(0.1, min(0.3, self.avg_response_ms / 2000))
+        start = time.time()
+        response = self.local_client.read_output_stable(timeout=timeout, stability_threshold=stability_threshold)
+        if response:
+            # Time spent waiting for the settle window is not latency
+            latency_ms = max(0.0, (time.time() - start - stability_threshold) * 1000)
+            self.avg_response_ms += 0.2 * (latency_ms - self.avg_response_ms)
+        return response
+
     def _log_activity(self, message: str, level: str = "info") -> None:
         """
         Log an activity message to the unified display panel.
@@ -417,6 +864,10 @@ class DCSSBot:
         
         Saves both raw ANSI and cleaned versions, and updates index.
         Also captures the full visual screen state from the screen buffer.
+        Skipped entirely unless capture_all_screens is enabled. Only the inputs are
+        captured here; cleaning, box drawing and all writes happen on the background
+        writer thread so the game loop never waits on them. If the writer has fallen
+        DEBUG_QUEUE_SIZE jobs behind, the capture is dropped with a warning.
         
         Args:
             screen: The game screen content (with ANSI codes)
@@ -425,114 +876,135 @@ class DCSSBot:
         Returns:
             The filename where the screen was saved
         """
+        if not self.capture_all_screens:
+            return ""
+        
         try:
-            self.screen_counter += 1
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            
-            # Create numbered filenames
-            screen_num = f"{self.screen_counter:04d}"
-            raw_file = f"{screen_num}_raw.txt"
-            clean_file = f"{screen_num}_clean.txt"
-            visual_file = f"{screen_num}_visual.txt"
-            raw_path = os.path.join(self.debug_screens_dir, raw_file)
-            clean_path = os.path.join(self.debug_screens_dir, clean_file)
-            visual_path = os.path.join(self.debug_screens_dir, visual_file)
-            
-            # Get the full visual screen from buffer
-            visual_screen = self._get_screen_capture()
+            counter = self.screen_counter + 1
+            timestamp = timestamp_ms()
             
-            # Save raw screen with ANSI codes
-            with open(raw_path, 'w', encoding='utf-8') as f:
-                f.write(f"=== Screen #{self.screen_counter} ===\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Move: #{self.move_count}\n")
-                f.write(f"Action: {action}\n")
-                f.write("=" * 80 + "\n\n")
-                f.write(screen)
-            
-            # Save cleaned screen (no ANSI codes)
-            clean_screen = self._clean_ansi(screen)
-            with open(clean_path, 'w', encoding='utf-8') as f:
-                f.write(f"=== Screen #{self.screen_counter} (Cleaned Delta) ===\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Move: #{self.move_count}\n")
-                f.write(f"Action: {action}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                # Format cleaned screen with visible borders for clarity
-                lines = clean_screen.split('\n')
-                f.write("┌" + "─" * 78 + "┐\n")
-                for line in lines:
-                    # Pad or truncate to 78 chars
-                    line = line.ljust(78)[:78]
-                    f.write("│ " + line + " │\n")
-                f.write("└" + "─" * 78 + "┘\n")
-            
-            # Save visual screen (accumulated state from buffer)
-            with open(visual_path, 'w', encoding='utf-8') as f:
-                f.write(f"=== Screen #{self.screen_counter} (Full Visual State) ===\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Move: #{self.move_count}\n")
-                f.write(f"Action: {action}\n")
-                f.write("=" * 80 + "\n\n")
-                
-                # Format visual screen with visible borders
-                lines = visual_screen.split('\n')
-                f.write("┌" + "─" * 118 + "┐\n")
-                for line in lines:
-                    # Pad or truncate to 118 chars to show full game screen
-                    line = line.ljust(118)[:118]
-                    f.write("│" + line + "│\n")
-                f.write("└" + "─" * 118 + "┘\n")
-            
-            # Update index file
-            try:
-                with open(self.screen_index_file, 'a') as f:
-                    f.write(f"[{self.screen_counter:04d}] Move #{self.move_count} at {timestamp}\n")
-                    f.write(f"        Action: {action}\n")
-                    f.write(f"        Raw: {raw_file} ({len(screen)} bytes)\n")
-                    f.write(f"        Clean: {clean_file} ({len(clean_screen)} chars)\n")
-                    f.write(f"        Visual: {visual_file}\n")
-                    f.write("\n")
-            except Exception as e:
-                logger.debug(f"Failed to update screen index: {e}")
-            
-            return visual_file
+            # Snapshot the full visual screen now; the buffer keeps changing after we return
+            visual_screen = self._get_screen_capture()
+            if not self.debug_writer.offer(
+                self._write_debug_screen, counter, self.move_count,
+                timestamp, screen, visual_screen, action
+            ):
+                logger.warning(f"Debug writer queue full - dropping screen capture for: {action}")
+                return ""
+            self.screen_counter = counter
+            return f"{counter:04d}_visual.txt"
         
         except Exception as e:
             logger.error(f"Failed to save debug screen #{self.screen_counter}: {e}")
             logger.error(f"  Debug dir: {self.debug_screens_dir}")
             logger.error(f"  Action: {action}")
-            import traceback
             logger.error(f"  Traceback: {traceback.format_exc()}")
             return ""
 
+    def _write_debug_screen(self, screen_counter: int, move_count: int, timestamp: str,
+                            screen: str, visual_screen: str, action: str) -> None:
+        """
+        Format and write one debug screen capture (runs on the background writer thread).
+        
+        Args:
+            screen_counter: Capture number used for the filenames
+            move_count: Move number at capture time
+            timestamp: Capture time (HH:MM:SS.mmm)
+            screen: The game screen content (with ANSI codes)
+            visual_screen: Full visual screen from the buffer at capture time
+            action: The action being performed or description
+        """
+        # Create numbered filenames
+        screen_num = f"{screen_counter:04d}"
+        raw_file = f"{screen_num}_raw.txt"
+        clean_file = f"{screen_num}_clean.txt"
+        visual_file = f"{screen_num}_visual.txt"
+        
+        clean_screen = _strip_ansi(screen)
+        
+        context = (
+            f"Timestamp: {timestamp}\n"
+            f"Move: #{move_count}\n"
+            f"Action: {action}\n"
+            + "=" * 80 + "\n\n"
+        )
+        
+        # Raw screen with ANSI codes
+        raw_text = f"=== Screen #{screen_counter} ===\n" + context + screen
+        
+        # Cleaned screen (no ANSI codes), padded/truncated to 78 chars inside a visible border
+        clean_text = (
+            f"=== Screen #{screen_counter} (Cleaned Delta) ===\n" + context
+            + "┌" + "─" * 78 + "┐\n"
+            + "".join("│ " + line.ljust(78)[:78] + " │\n" for line in clean_screen.split('\n'))
+            + "└" + "─" * 78 + "┘\n"
+        )
+        
+        # Visual screen (accumulated state from buffer), 118 chars wide to show the full game screen
+        visual_text = (
+            f"=== Screen #{screen_counter} (Full Visual State) ===\n" + context
+            + "┌" + "─" * 118 + "┐\n"
+            + "".join("│" + line.ljust(118)[:118] + "│\n" for line in visual_screen.split('\n'))
+            + "└" + "─" * 118 + "┘\n"
+        )
+        
+        for filename, text in ((raw_file, raw_text), (clean_file, clean_text), (visual_file, visual_text)):
+            with open(os.path.join(self.debug_screens_dir, filename), 'w', encoding='utf-8') as f:
+                f.write(text)
+        
+        # Update index file
+        try:
+            self._index_fp.write(
+                f"[{screen_num}] Move #{move_count} at {timestamp}\n"
+                f"        Action: {action}\n"
+                f"        Raw: {raw_file} ({len(screen)} bytes)\n"
+                f"        Clean: {clean_file} ({len(clean_screen)} chars)\n"
+                f"        Visual: {visual_file}\n"
+                "\n"
+            )
+            self._index_entries_since_flush += 1
+            if self._index_entries_since_flush >= self.INDEX_FLUSH_INTERVAL:
+                self._index_fp.flush()
+                self._index_entries_since_flush = 0
+        except Exception as e:
+            logger.debug(f"Failed to update screen index: {e}")
+
     def _log_screen_and_action(self, screen: str, action: str) -> None:
         """
         Log the current screen state and the action being taken.
         
+        Written on the caller's thread: loguru appends to the same file from this
+        thread, so a background write would land between unrelated log lines.
+        
         Args:
             screen: The game screen content
             action: The action being performed
         """
         try:
-            with open(self.log_file, 'a') as f:
-                # Write timestamp and move number
-                timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                f.write(f"[{timestamp}] Move #{self.move_count}\n")
-                f.write(f"Action: {action}\n")
-                f.write("-" * 80 + "\n")
-                
-                # Write the cleaned screen content
-                clean_screen = self._clean_ansi(screen)
-                f.write("SCREEN:\n")
-                f.write(clean_screen)
-                f.write("\n")
-                f.write("=" * 80 + "\n\n")
+            f = self._log_fp
+            f.write(
+                f"[{timestamp_ms()}] Move #{self.move_count}\n"
+                f"Action: {action}\n"
+                + "-" * 80 + "\n"
+                "SCREEN:\n"
+                + self._clean_ansi(screen) + "\n"
+                + "=" * 80 + "\n\n"
+            )
+            # loguru appends to the same file, so flush to keep entries in order
+            f.flush()
                 
         except Exception as e:
             logger.error(f"Failed to write to log file: {e}")
 
+    def _close_log_files(self) -> None:
+        """Drain pending background writes, then flush and close the session log and screen index."""
+        self.debug_writer.close()
+        for fp in (self._log_fp, self._index_fp):
+            try:
+                fp.close()
+            except Exception:
+                pass
+
     def _detect_menu_type(self, screen: str) -> str:
         """
         Detect what type of menu is currently displayed.
@@ -543,40 +1015,21 @@ class DCSSBot:
         Returns:
             Menu type ('race', 'class', 'background', 'weapons', 'skills', 'difficulty', 'abilities', 'unknown')
         """
-        clean = self._clean_ansi(screen).lower()
+        clean = self._lower_clean(screen)
         
         # First check if this looks like a game state, not a menu
         # Game states have dungeon map elements
-        if '@' in screen and any(char in screen for char in ['#', '+', '.', ' ']):
+        # (isdisjoint stops at the first map glyph)
+        if '@' in screen and not _MAP_CHARS.isdisjoint(screen):
             # This looks like a dungeon map with the player character
-            if any(word in clean for word in ['exp:', 'ac:', 'hp:', '@']):
+            if any(marker in clean for marker in _GAME_MARKERS):
                 return 'unknown'  # This is the game, not a menu
         
         # Now check for specific menus - use the actual DCSS menu text
-        if any(phrase in clean for phrase in ['select your species', 'select your ancestry', 'please select your species',
-                                                'choose your race', 'choose your species', 'species:', 'ancestry:', 
-                                                'which species', 'which ancestry', 'which race']):
-            return 'race'
-        elif any(phrase in clean for phrase in ['select your class', 'please select your class',
-                                                  'choose your class', 'job:', 'profession:', 'which class', 
-                                                  'which job', 'choose your job']):
-            return 'class'
-        elif any(phrase in clean for phrase in ['choice of weapons', 'choice of melee weapons', 'choice of ranged weapons',
-                                                  'weapon choice']):
-            return 'weapons'
-        elif any(phrase in clean for phrase in ['select your background', 'please select your background',
-                                                  'background:', 'background -', 'choose background', 
-                                                  'religious choice']):
-            return 'background'
-        elif any(phrase in clean for phrase in ['skill aptitudes', 'skill -', 'skill points', 'choose skills',
-                                                  'select your skills']):
-            return 'skills'
-        elif any(phrase in clean for phrase in ['difficulty', 'challenge', 'permadeath', 'hardcore',
-                                                  'select your difficulty']):
-            return 'difficulty'
-        elif any(phrase in clean for phrase in ['ability', 'ability -', 'abil:', 'ability scores',
-                                                  'select your ability']):
-            return 'abilities'
+        # The first menu type, in priority order, with any of its phrases on screen wins
+        for menu_type, phrases in _MENU_PHRASES:
+            if any(phrase in clean for phrase in phrases):
+                return menu_type
         
         return 'unknown'
     
@@ -591,70 +1044,19 @@ class DCSSBot:
         Returns:
             Command to send (single character)
         """
-        clean = self._clean_ansi(screen).lower()
-        
-        # Character preferences
-        # Race: Gnoll
-        # Class: Fighter  
-        # Weapon: War Axe
-        
-        if menu_type == 'race':
-            # Prefer Gnoll
-            if 'gnoll' in clean:
-                logger.info("Menu: Choosing Gnoll (g)")
-                return 'g'
-            elif 'human' in clean:
-                logger.info("Menu: Choosing Human (h) - Gnoll not available")
-                return 'h'
-            else:
-                logger.info("Menu: Choosing first race option (a)")
-                return 'a'
-        
-        elif menu_type == 'class':
-            # Always choose Fighter
-            if 'fighter' in clean:
-                logger.info("Menu: Choosing Fighter (f)")
-                return 'f'
-            else:
-                logger.info("Menu: Choosing first class option (a)")
-                return 'a'
-        
-        elif menu_type == 'background':
-            # Choose first option (background doesn't matter much)
-            logger.info("Menu: Choosing default option for background (a)")
-            return 'a'
-        
-        elif menu_type == 'weapons':
-            # Prefer War Axe
-            if 'war axe' in clean:
-                logger.info("Menu: Choosing War Axe (w)")
-                return 'w'
-            elif 'axe' in clean:
-                logger.info("Menu: Choosing Axe (a)")
-                return 'a'
-            else:
-                logger.info("Menu: Choosing first weapon option (a)")
-                return 'a'
-        
-        elif menu_type == 'skills':
-            # Choose first skill option
-            logger.info("Menu: Choosing default option for skills (a)")
-            return 'a'
-        
-        elif menu_type == 'abilities':
-            # Choose first ability option
-            logger.info("Menu: Choosing default option for abilities (a)")
-            return 'a'
-        
-        elif menu_type == 'difficulty':
-            # Choose first difficulty option (Normal)
-            logger.info("Menu: Choosing default option for difficulty (a)")
-            return 'a'
-        
-        else:
+        choices = _MENU_CHOICES.get(menu_type)
+        if choices is None:
             # Unknown menu - log and return None instead of guessing
             logger.warning(f"Menu: Unknown menu type '{menu_type}', cannot choose")
             return None
+        
+        clean = self._lower_clean(screen)
+        
+        # First preferred option present on screen wins; the None entry is the fallback
+        for option, key, message in choices:
+            if option is None or option in clean:
+                logger.info(message)
+                return key
 
     def _display_screen(self, screen: str, action: str = None) -> None:
         """
@@ -669,23 +1071,15 @@ class DCSSBot:
             return
         
         try:
-            import sys
-            
             # Keep ANSI codes for display (colors are important for readability)
             display_screen = screen
             
-            # Split into lines but preserve empty lines (needed for dungeon map)
-            lines = display_screen.split('\n')
-            
-            # Clear screen and move to top
-            sys.stdout.write("\033[2J\033[H")  # Clear screen and move cursor to top
-            sys.stdout.flush()
-            
-            # Display game screen content with ANSI colors intact
-            for line in lines:
-                sys.stdout.write(line + '\n')
-            
-            sys.stdout.flush()
+            # Clear screen, move to top, then the game screen content with ANSI colors intact
+            # (every line newline-terminated, empty lines preserved for the dungeon map)
+            self._write_terminal("\033[2J\033[H" + display_screen + "\n")
+            # The unified display's rows were wiped: its next frame must be a full redraw
+            self.unified_display.invalidate()
+            self._last_display_key = None
             
             # Log the action
             logger.info(f"Move {self.move_count:04d}: {self.last_action} ({len(display_screen)} bytes)")
@@ -706,21 +1100,41 @@ class DCSSBot:
         if not visual_screen or not visual_screen.strip():
             return
         
+        # Double-buffering: an identical frame is already on the terminal
+        if visual_screen == self._last_visual_frame:
+            return
+        
         try:
-            import sys
-            
-            # Clear screen and move to top
-            sys.stdout.write("\033[2J\033[H")  # Clear screen and move cursor to top
-            sys.stdout.flush()
-            
-            # Display the complete accumulated game screen
-            # This is the full visual state, not just what changed
-            sys.stdout.write(visual_screen)
-            sys.stdout.flush()
+            # Clear screen, move to top, then the complete accumulated game screen
+            # (the full visual state, not just what changed) in a single write
+            self._write_terminal("\033[2J\033[H" + visual_screen)
+            self._last_visual_frame = visual_screen
             
         except Exception as e:
             logger.error(f"Error displaying visual screen: {e}")
 
+    def _write_terminal(self, text: str) -> None:
+        """
+        Write text to the terminal with a single os.write on stdout's file descriptor.
+        
+        Falls back to sys.stdout.write when stdout has no real descriptor (e.g. captured).
+        
+        Args:
+            text: Complete frame to write, including any escape sequences
+        """
+        sys.stdout.flush()  # Anything already buffered must land before this frame
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            return
+        
+        payload = memoryview(text.encode('utf-8', 'replace'))
+        while payload:
+            written = os.write(fd, payload)  # Loops only on a short write
+            payload = payload[written:]
+
     def run(self, max_steps: int = 1000) -> None:
         """
         Run the bot.
@@ -731,6 +1145,7 @@ class DCSSBot:
         self.max_steps = max_steps  # Store for display in TUI
         if not self.local_client.connect():
             logger.error("Failed to connect to server")
+            self._close_log_files()
             return
 
         # Mark that we've connected in the state tracker
@@ -744,6 +1159,8 @@ class DCSSBot:
         if not self._local_startup():
             logger.error("Failed to complete startup sequence")
             self.local_client.disconnect()
+            # Keep the startup screens queued for the writer: they show why startup failed
+            self._close_log_files()
             return
         logger.info("Startup complete, game started")
         
@@ -757,15 +1174,12 @@ class DCSSBot:
             last_display = 0  # Track when we last displayed
             
             # Debug: Read and display initial game state
+            # One stable read returns as soon as the first screen settles (up to 3s)
             logger.info("Reading initial game state...")
-            for debug_i in range(3):
-                initial_output = self.local_client.read_output(timeout=1.0)
-                if initial_output:
-                    self.last_screen = initial_output
-                    logger.info(f"Got initial output on attempt {debug_i+1}: {len(initial_output)} bytes")
-                    break
-                else:
-                    logger.debug(f"No output on attempt {debug_i+1}")
+            initial_output = self.local_client.read_output_stable(timeout=3.0, stability_threshold=0.5)
+            if initial_output:
+                self.last_screen = initial_output
+                logger.info(f"Got initial output: {len(initial_output)} bytes")
             
             # Log the initial game state
             if self.last_screen:
@@ -776,7 +1190,7 @@ class DCSSBot:
                 
                 # Capture initial experience for tracking
                 # At startup, screen buffer may not be initialized yet, so parse raw output
-                self.parser.parse_output(self.last_screen)
+                self._parse_output(self.last_screen)
                 self.initial_experience_level = self.parser.state.experience_level
                 self.initial_experience_progress = self.parser.state.experience_progress
                 logger.info(f"Initial experience: Level {self.initial_experience_level}, Progress {self.initial_experience_progress}%")
@@ -796,15 +1210,30 @@ class DCSSBot:
                     
                     # Update screen buffer with PTY output to build complete visual state
                     self.screen_buffer.update_from_output(output)
+                    self.last_screen = output  # Keep raw for logging
+                else:
+                    logger.debug(f"Move {self.move_count}: No new output from server (using cached screen)")
+                    consecutive_no_output += 1
+                
+                # Output that only repositions the cursor (or repaints identical text) leaves
+                # the buffer version alone; everything derived from a screen (parsed state,
+                # events, game-over check) runs once per buffer change, whether the change
+                # arrived here or with the previous move's response
+                if self.screen_buffer.version == self._checked_screen_version:
+                    logger.debug(f"Move {self.move_count}: Screen unchanged, skipping parse")
+                else:
+                    self._checked_screen_version = self.screen_buffer.version
                     
                     # Parse game state from the accumulated buffer (not raw delta)
                     # Buffer contains complete reconstructed display with all information
-                    buffer_text = self.screen_buffer.get_screen_text()
-                    self.last_screen = output  # Keep raw for logging
-                    self.parser.parse_output(buffer_text)
+                    buffer_text = self._parse_screen_buffer()
                     
-                    # Detect and log exploration events from the buffer
-                    self._detect_exploration_events(buffer_text)
+                    # Events are game messages: scan only the message log rows, and only
+                    # when they changed (moving around mostly repaints the map)
+                    message_text = self.screen_buffer.get_message_log_text()
+                    if message_text != self._last_event_text:
+                        self._last_event_text = message_text
+                        self._detect_exploration_events(message_text)
                     
                     # Check game over conditions using buffer text
                     if self.parser.is_game_over(buffer_text):
@@ -813,13 +1242,12 @@ class DCSSBot:
                         self._save_debug_screen(self.last_screen, "GAME OVER")
                         self._display_screen(self.last_screen, "Game Over!")
                         break
-                else:
-                    logger.debug(f"Move {self.move_count}: No new output from server (using cached screen)")
-                    consecutive_no_output += 1
                 
                 # Decide next action based on current game state
                 # Use screen buffer text (clean reconstructed state) for enemy detection
                 # Raw last_screen may have jumbled ANSI codes; pyte buffer has accurate reconstruction
+                # (get_screen_text is memoized until the buffer changes, so this is the same
+                # string the parser saw, not a second reconstruction)
                 screen_for_decision = self.screen_buffer.get_screen_text() if self.last_screen else ""
                 action = self._decide_action(screen_for_decision)
                 action_desc = f"Sending '{action}'" if action else "Wait"
@@ -832,20 +1260,16 @@ class DCSSBot:
                         self.local_client.send_command(action)
                         self.move_count += 1
                         
-                        # Wait for server to process the command (local needs more time)
-                        logger.debug(f"Waiting 0.25 seconds for server to process '{action}'...")
-                        time.sleep(0.25)
-                        
-                        # Read the response - wait for stable output
-                        response = self.local_client.read_output_stable(timeout=3.5, stability_threshold=0.3)
+                        # Read the response as soon as it settles (no fixed wait beforehand)
+                        response = self._read_response(timeout=3.5)
                         if response:
                             consecutive_no_output = 0  # Reset idle counter when we get any output
                             
-                            # Use raw response directly for parsing and display
+                            # Keep the raw response for logging and display
                             self.last_screen = response
                             # Update screen buffer with the new output so visual display shows full state
                             self.screen_buffer.update_from_output(response)
-                            self.parser.parse_output(response)
+                            self._parse_screen_buffer()
                         else:
                             logger.error(f"No response from server after sending '{action}'")
                             # Detailed diagnostics for debugging
@@ -853,8 +1277,9 @@ class DCSSBot:
                             logger.error(f"  Health parsed: {self.parser.state.health}/{self.parser.state.max_health}")
                             logger.error(f"  Action chosen: '{action}'")
                             if self.last_screen:
-                                clean = self._clean_ansi(self.last_screen)
-                                logger.error(f"  Last screen preview: {clean[:100]}...")
+                                logger.opt(lazy=True).error(
+                                    "  Last screen preview: {}...", lambda: self._clean_last_screen()[:100]
+                                )
                             self.unchanged_screen_count += 1
                         
                         # Check if we've had too many unchanged screens
@@ -864,8 +1289,9 @@ class DCSSBot:
                             logger.error(f"🔴 Last health: {self.parser.state.health}/{self.parser.state.max_health}")
                             logger.error(f"🔴 Server not responding properly - exiting gameplay loop")
                             if self.last_screen:
-                                clean = self._clean_ansi(self.last_screen)
-                                logger.error(f"🔴 Last screen: {clean[:150]}...")
+                                logger.opt(lazy=True).error(
+                                    "🔴 Last screen: {}...", lambda: self._clean_last_screen()[:150]
+                                )
                             break
                         
                         # Log action to activity panel
@@ -889,16 +1315,13 @@ class DCSSBot:
                         self.local_client.send_command('.')
                         self.move_count += 1
                         
-                        # Wait for server to process (at least 2 seconds)
-                        logger.debug("Waiting 3 seconds for server to process '.'...")
-                        time.sleep(3.0)
-                        
-                        # Read the response with longer timeout
-                        response = self.local_client.read_output(timeout=3.0)
+                        # Read the response as soon as it settles, allowing longer for a rest turn
+                        response = self._read_response(timeout=6.0)
                         if response:
-                            # Clean both screens for comparison
-                            prev_clean = self._clean_ansi(self.last_screen) if self.last_screen else ""
-                            curr_clean = self._clean_ansi(response)
+                            # Clean both screens for comparison; identical raw output cleans
+                            # identically, so only a different response needs a regex pass
+                            prev_clean = self._clean_last_screen()
+                            curr_clean = prev_clean if response == self.last_screen else _strip_ansi(response)
                             
                             # Check if screen actually changed
                             if curr_clean == prev_clean:
@@ -909,21 +1332,27 @@ class DCSSBot:
                                 logger.info(f"Screen CHANGED: {len(self.last_screen) if self.last_screen else 0} → {len(response)} bytes")
                                 
                             self.last_screen = response
-                            self.parser.parse_output(response)
+                            # Seed the clean-last-screen cache so this response is never cleaned twice
+                            self._last_screen_cleaned_for = response
+                            self._last_screen_cleaned = curr_clean
+                            self.screen_buffer.update_from_output(response)
+                            self._parse_screen_buffer()
                         else:
                             logger.error("No response from server after sending '.'")
                             # Detailed diagnostics for debugging
                             logger.error(f"  Last screen size: {len(self.last_screen) if self.last_screen else 0} bytes")
                             logger.error(f"  Health parsed: {self.parser.state.health}/{self.parser.state.max_health}")
                             if self.last_screen:
-                                has_health = 'Health:' in self.last_screen or 'health:' in self.last_screen
-                                has_time = 'Time:' in self.last_screen
-                                has_combat = any(indicator in self.last_screen for indicator in [
-                                    'You encounter', 'block', 'miss', 'hits', 'damage', 'rat', 'bat'
-                                ])
-                                logger.error(f"  Gameplay indicators - Health:{has_health}, Time:{has_time}, Combat:{has_combat}")
-                                clean = self._clean_ansi(self.last_screen)
-                                logger.error(f"  Last screen preview: {clean[:100]}...")
+                                screen = self.last_screen
+                                logger.opt(lazy=True).error(
+                                    "  Gameplay indicators - Health:{}, Time:{}, Combat:{}",
+                                    lambda: 'Health:' in screen or 'health:' in screen,
+                                    lambda: 'Time:' in screen,
+                                    lambda: _COMBAT_HINT_RE.search(screen) is not None,
+                                )
+                                logger.opt(lazy=True).error(
+                                    "  Last screen preview: {}...", lambda: self._clean_last_screen()[:100]
+                                )
                             self.unchanged_screen_count += 1
                         
                         # Check if we've had too many unchanged screens
@@ -933,8 +1362,9 @@ class DCSSBot:
                             logger.error(f"🔴 Last health: {self.parser.state.health}/{self.parser.state.max_health}")
                             logger.error(f"🔴 Server not responding properly - exiting gameplay loop")
                             if self.last_screen:
-                                clean = self._clean_ansi(self.last_screen)
-                                logger.error(f"🔴 Last screen: {clean[:150]}...")
+                                logger.opt(lazy=True).error(
+                                    "🔴 Last screen: {}...", lambda: self._clean_last_screen()[:150]
+                                )
                             break
                         
                         # Log screen and action
@@ -976,6 +1406,8 @@ class DCSSBot:
             # Reset terminal to normal state before disconnecting
             self._reset_terminal()
             self.local_client.disconnect()
+            # Drains screen captures still queued for the background writer
+            self._close_log_files()
 
     def _detect_items_on_ground(self, output: str) -> bool:
         """
@@ -1005,11 +1437,11 @@ class DCSSBot:
         if not output:
             return False
         
-        clean_output = self._clean_ansi(output) if output else ""
+        lower = self._lower_clean(output)
         
         # Check if game says "There are no items here" or "Nothing to pick up"
         # These indicate the grab attempt just failed (or there was nothing on the ground)
-        if 'there are no items here' in clean_output.lower() or 'nothing to pick up' in clean_output.lower():
+        if 'there are no items here' in lower or 'nothing to pick up' in lower:
             self.last_grab_attempt = self.move_count
             self.last_grab_failed = True
             logger.debug("Nothing on ground or grab failed - auto-explore likely already picked up items")
@@ -1028,31 +1460,31 @@ class DCSSBot:
         # Check for common item messages indicating items on ground
         # Use message log area from TUI parser for more reliable detection
         screen_text = self.screen_buffer.get_screen_text() if self.last_screen else ""
-        if screen_text:
+        # The message log is part of the screen, so without either phrase on screen the
+        # layout parse below could not find anything - skip it
+        if screen_text and _GROUND_MESSAGE_RE.search(screen_text):
             try:
-                tui_parser = DCSSLayoutParser()
-                tui_areas = tui_parser.parse_layout(screen_text)
+                tui_areas = self._get_tui_areas()
                 message_log_area = tui_areas.get('message_log', None)
                 if message_log_area:
-                    message_content = message_log_area.get_text()
+                    message_content = message_log_area.get_text().lower()
                     
                     # If we see "there are no items here", no point trying to grab
-                    if 'there are no items here' in message_content.lower():
+                    if 'there are no items here' in message_content:
                         self.last_grab_failed = True
                         self.last_grab_attempt = self.move_count
                         return False
                     
                     # Check for "You see here" messages
-                    if 'you see here' in message_content.lower():
+                    if 'you see here' in message_content:
                         # But filter out corpses and unwanted items
                         # Check if the item is a corpse (carrion) - skip these
-                        if 'corpse' in message_content.lower():
+                        if 'corpse' in message_content:
                             logger.debug("Skipping corpse on ground (not useful)")
                             return False
                         
                         # Filter out missiles (arrows, stones, etc)
-                        missile_keywords = ['stone', 'arrow', 'bolt', 'dart', 'javelin', 'sling bullet']
-                        if any(keyword in message_content.lower() for keyword in missile_keywords):
+                        if any(word in message_content for word in _MISSILE_WORDS):
                             logger.debug("Skipping missiles on ground (not our priority)")
                             return False
                         
@@ -1063,15 +1495,15 @@ class DCSSBot:
         
         # Fallback: check common item keywords
         # Skip corpses and missiles in fallback
-        has_corpse = 'corpse' in clean_output.lower()
-        has_missile = any(word in clean_output.lower() for word in ['stone', 'arrow', 'bolt', 'dart', 'javelin', 'sling bullet'])
+        has_corpse = 'corpse' in lower
+        has_missile = any(word in lower for word in _MISSILE_WORDS)
         
         if has_corpse or has_missile:
             logger.debug("Skipping corpse or missiles detected in output")
             return False
         
         # Only trigger on specific indicators
-        has_item_indicator = 'you see here' in clean_output.lower()
+        has_item_indicator = 'you see here' in lower
         
         return has_item_indicator
     
@@ -1115,10 +1547,8 @@ class DCSSBot:
         if not output:
             return False
         
-        clean_output = self._clean_ansi(output) if output else ""
-        
         # Check for the distinctive "Pick up what?" prompt
-        return 'pick up what?' in clean_output.lower()
+        return 'pick up what?' in self._lower_clean(output)
     
     def _handle_item_pickup_menu(self, output: str) -> Optional[str]:
         """
@@ -1140,37 +1570,16 @@ class DCSSBot:
         Returns:
             Action command to handle the menu
         """
-        clean_output = self._clean_ansi(output) if output else ""
-        
         # Check what categories of items are available
-        has_carrion = 'carrion' in clean_output.lower()
-        has_missiles = 'missiles' in clean_output.lower()
-        has_hand_weapons = 'hand weapons' in clean_output.lower()
-        has_armor = 'armour' in clean_output.lower() or 'armor' in clean_output.lower()
+        lower = self._lower_clean(output)
+        has_carrion = 'carrion' in lower
+        has_missiles = 'missiles' in lower
+        has_hand_weapons = 'hand weapons' in lower
+        has_armor = 'armour' in lower or 'armor' in lower
         
         logger.debug(f"Item menu: Carrion={has_carrion}, Missiles={has_missiles}, Weapons={has_hand_weapons}, Armor={has_armor}")
         
-        # Parse the lines to see what items are available
-        lines = clean_output.split('\n')
-        has_useful_items = False
-        
-        for line in lines:
-            line_lower = line.lower()
-            
-            # Skip carrion - completely useless
-            if 'kobold corpse' in line_lower or 'orc corpse' in line_lower or 'corpse' in line_lower and 'carrion' in clean_output:
-                continue
-            
-            # Skip missiles (arrows, stones, etc)
-            if 'stones' in line_lower or 'arrow' in line_lower or 'bolt' in line_lower:
-                continue
-            
-            # Skip +0 weapons (we have an axe already that's as good)
-            if '+0' in line_lower and ('dagger' in line_lower or 'sword' in line_lower or 'axe' in line_lower or 'spear' in line_lower):
-                continue
-            
-            # TODO: Could add +1 or +2 weapon detection, but for now skip all non-trivial evaluations
-            
+        # TODO: Could evaluate individual items (+1 or +2 weapons, armour AC) to pick up useful ones.
         # Since we don't have a good way to evaluate items without deeper parsing,
         # and the items shown are all ones we don't want (corpses, missiles, +0 weapons),
         # close the menu with Escape
@@ -1201,10 +1610,8 @@ class DCSSBot:
         logger.info(f"🔮 Found untested {color} potion in slot '{slot}' - quaffing to identify...")
         self._log_activity(f"Quaffing {color} potion (slot {slot}) to identify effect", "info")
         
-        # Send quaff command: 'q' + slot letter
-        # We need to send this as two separate commands
-        self.quaff_slot = slot  # Store for next step
-        return self._return_action('q', f"Quaffing {color} potion to identify (slot {slot})")
+        # Send quaff command and slot letter together: one write, one response to wait for
+        return self._return_action('q' + slot, f"Quaffing {color} potion to identify (slot {slot})")
     
     def _refresh_inventory(self) -> Optional[str]:
         """
@@ -1242,24 +1649,23 @@ class DCSSBot:
         clean_output = self._clean_ansi(output) if output else ""
         
         # Check for multiple inventory indicators
-        # 1. Look for inventory entries (letter, space/paren, item name)
-        inventory_pattern = r'^[a-z]\s*[-\)]\s+'
-        in_inventory = any(re.match(inventory_pattern, line.strip()) for line in clean_output.split('\n'))
+        # 1. Look for inventory entries (letter, space/paren, item name) - one scan counts them all
+        item_line_count = len(_INVENTORY_LINE_RE.findall(clean_output))
+        in_inventory = item_line_count > 0
         
         # 2. Alternative: Look for distinctive inventory header lines like "Inventory: X/Y slots"
         if not in_inventory:
-            in_inventory = 'inventory:' in clean_output.lower() and ('slots' in clean_output.lower() or '/' in clean_output)
+            lower_output = self._lower_clean(output)
+            in_inventory = 'inventory:' in lower_output and ('slots' in lower_output or '/' in clean_output)
         
         # 3. If we were expecting inventory and got item entries, that's inventory
         if not in_inventory and self.in_inventory_screen:
             # We sent 'i' command but don't see clear inventory markers
             # Check if screen shows items (this could be inventory or game screen with items visible)
             # Look for consistent item patterns
-            lines = clean_output.split('\n')
-            item_lines = [line for line in lines if re.match(inventory_pattern, line.strip())]
-            if len(item_lines) >= 2:  # At least 2 items visible suggests inventory screen
+            if item_line_count >= 2:  # At least 2 items visible suggests inventory screen
                 in_inventory = True
-                logger.debug(f"Detected inventory screen by item count ({len(item_lines)} items)")
+                logger.debug(f"Detected inventory screen by item count ({item_line_count} items)")
         
         if in_inventory:
             logger.debug("Currently in inventory screen")
@@ -1273,9 +1679,12 @@ class DCSSBot:
             self.parser.parse_inventory_screen(output)
             logger.info(f"📦 Parsed inventory: {len(self.parser.state.inventory_items)} items")
             
-            # Log current inventory
-            for slot, item in self.parser.state.inventory_items.items():
-                logger.debug(f"  {slot}: {item.name} (type={item.item_type}, identified={item.identified})")
+            # Log current inventory as one record, formatted only if a sink takes DEBUG
+            items = self.parser.state.inventory_items
+            logger.opt(lazy=True).debug("Inventory contents:\n{}", lambda: "\n".join(
+                f"  {slot}: {item.name} (type={item.item_type}, identified={item.identified})"
+                for slot, item in items.items()
+            ))
             
             # Exit inventory screen with Escape
             return self._return_action('\x1b', "Exiting inventory screen")
@@ -1297,24 +1706,12 @@ class DCSSBot:
         Returns:
             Tuple of (color, effect) if we can determine it, None otherwise
         """
-        clean_output = self._clean_ansi(output) if output else ""
-        
-        # Common potion effect messages
-        potion_effects = {
-            'healing': ['you feel much better', 'you are healed', 'wounds are healed', 'recover'],
-            'cure poison': ['poison is cured', 'lose the poison', 'no longer poisoned'],
-            'might': ['you feel strong', 'you feel invigorated', 'feel mighty'],
-            'magic': ['glow briefly', 'feel more magical', 'magic improves'],
-            'agility': ['feel quick', 'feel nimble', 'faster'],
-            'resistance': ['feel resistant', 'protected from elements', 'more resilient'],
-            'levitation': ['you float', 'you ascend', 'lose your footing'],
-            'flight': ['you fly', 'grow wings', 'soar'],
-        }
+        clean_lower = self._lower_clean(output)
         
         # Try to match effect from messages
-        for effect, keywords in potion_effects.items():
+        for effect, keywords in _POTION_EFFECTS.items():
             for keyword in keywords:
-                if keyword in clean_output.lower():
+                if keyword in clean_lower:
                     # Get the color from our untested potions tracking
                     # For now, just return the effect (color will be matched by caller)
                     return ('unknown_color', effect)
@@ -1342,8 +1739,8 @@ class DCSSBot:
         # Only equip if significant improvement or currently unequipped slot
         if item.ac_value < -2:  # At least +2 protection
             logger.info(f"🛡️ Found better armor: {item.name} (AC {item.ac_value}) in slot '{slot}'")
-            self.equip_slot = slot  # Store for next step
-            return self._return_action('e', f"Equipping better armor: {item.name}")
+            # Send equip command and slot letter together: one write, one response to wait for
+            return self._return_action('e' + slot, f"Equipping better armor: {item.name}")
         
         return None
     
@@ -1369,13 +1766,8 @@ class DCSSBot:
     def _reset_terminal(self) -> None:
         """Reset terminal to normal state (clear ANSI codes, reset colors, show cursor)."""
         try:
-            import sys
-            # Reset all attributes
-            sys.stdout.write('\033[0m')      # Reset attributes
-            sys.stdout.write('\033[?25h')    # Show cursor
-            sys.stdout.write('\033[H')       # Move to home
-            sys.stdout.write('\033[2J')      # Clear screen
-            sys.stdout.flush()
+            # Reset attributes, show cursor, move to home and clear screen in one write
+            self._write_terminal('\033[0m\033[?25h\033[H\033[2J')
         except:
             pass
 
@@ -1392,10 +1784,9 @@ class DCSSBot:
             # First, get character experience/progression info before quitting
             logger.info("Retrieving character experience info with 'E' command...")
             self.local_client.send_command('E')
-            time.sleep(2.0)  # Wait for response
             
-            # Read experience screen
-            exp_output = self.local_client.read_output(timeout=2.0)
+            # Read experience screen as soon as it settles
+            exp_output = self.local_client.read_output_stable(timeout=4.0)
             if exp_output:
                 self.last_screen = exp_output
                 logger.info("Character experience screen received")
@@ -1403,7 +1794,7 @@ class DCSSBot:
                 self._display_screen(exp_output, "Final Character Experience Stats")
                 
                 # Capture final state from the experience screen (still has valid health/mana)
-                self.parser.parse_output(exp_output)
+                self._parse_output(exp_output)
                 self.final_health = self.parser.state.health
                 self.final_max_health = self.parser.state.max_health
                 self.final_mana = self.parser.state.mana
@@ -1419,10 +1810,9 @@ class DCSSBot:
             # Now send Ctrl-Q to quit
             logger.info("Sending Ctrl-Q to quit game...")
             self.local_client.send_command('\x11')  # Ctrl-Q
-            time.sleep(0.5)
             
-            # Read confirmation prompt
-            output = self.local_client.read_output(timeout=2.0)
+            # Read confirmation prompt as soon as it settles
+            output = self.local_client.read_output_stable(timeout=2.5)
             if output:
                 self.last_screen = output
                 clean = self._clean_ansi(output).lower()
@@ -1434,20 +1824,17 @@ class DCSSBot:
                     # Check if it's asking to type "quit"
                     if 'type quit' in clean or 'enter quit' in clean or 'type the word' in clean:
                         logger.info("Server asking to type 'quit' to confirm... sending 'quit'")
-                        self.local_client.send_command('quit')
-                        time.sleep(0.5)
-                        self.local_client.send_command('\r')  # Send enter/return
-                        time.sleep(1.0)
+                        # Word and enter/return in one write; the end-game reads below wait for the reply
+                        self.local_client.send_command('quit\r')
                     else:
                         # Generic confirmation prompt
                         logger.info("Confirming character abandon with 'y'...")
                         self.local_client.send_command('y')
-                        time.sleep(1.0)
                     
                     # Capture end-of-game screens
                     logger.info("Capturing end-of-game state screens...")
                     for screen_num in range(5):  # Try to capture up to 5 screens
-                        end_output = self.local_client.read_output(timeout=1.5)
+                        end_output = self.local_client.read_output_stable(timeout=2.5)
                         if end_output:
                             self.last_screen = end_output
                             clean_end = self._clean_ansi(end_output).lower()
@@ -1456,11 +1843,9 @@ class DCSSBot:
                             self._display_screen(end_output, f"End-game screen {screen_num + 1}")
                             
                             # Stop if we see character selection or main menu
-                            if any(word in clean_end for word in ['character', 'select', 'welcome to', 'not logged in']):
+                            if any(word in clean_end for word in _END_SCREEN_WORDS):
                                 logger.info("Reached character selection or main menu")
                                 break
-                            
-                            time.sleep(0.3)
                         else:
                             logger.debug(f"No more output for screen {screen_num + 1}")
                             break
@@ -1468,20 +1853,15 @@ class DCSSBot:
                     logger.info("✓ Game exited gracefully")
                 else:
                     logger.info("No clear quit confirmation detected, sending 'quit' anyway...")
-                    self.local_client.send_command('quit')
-                    time.sleep(0.5)
-                    self.local_client.send_command('\r')  # Send enter
-                    time.sleep(1.0)
+                    self.local_client.send_command('quit\r')  # Word and enter in one write
+                    self.local_client.read_output_stable(timeout=1.5)
             else:
                 logger.warning("No response to Ctrl-Q, attempting to send 'quit' anyway")
-                self.local_client.send_command('quit')
-                time.sleep(0.5)
-                self.local_client.send_command('\r')
-                time.sleep(1.0)
+                self.local_client.send_command('quit\r')
+                self.local_client.read_output_stable(timeout=1.5)
                 
         except Exception as e:
             logger.error(f"Error during graceful quit: {e}")
-            import traceback
             logger.debug(traceback.format_exc())
 
     def _return_action(self, action: str, reason: str) -> str:
@@ -1511,8 +1891,8 @@ class DCSSBot:
         Returns:
             DecisionContext with all current game state
         """
-        # Parse output to extract state
-        self.parser.parse_output(output)
+        # Parse output to extract state (skipped when the main loop just parsed this screen)
+        self._parse_output(output)
         
         # Get current values from parser
         health = self.parser.state.health
@@ -1521,11 +1901,7 @@ class DCSSBot:
         dungeon_level = self.parser.state.dungeon_level
         
         # Detect game situations (using existing helper methods)
-        enemy_detected, enemy_name = self._detect_enemy_in_range(output)
-        enemy_direction = None
-        if enemy_detected:
-            # Calculate direction to move toward the enemy when low health
-            enemy_direction = self._calculate_direction_to_enemy(output, enemy_name)
+        enemy_detected, enemy_name, enemy_direction = self._scan_enemies(output)
         
         items_on_ground = self._detect_items_on_ground(output)
         in_shop = self._is_in_shop(output)
@@ -1535,9 +1911,9 @@ class DCSSBot:
         
         # Check for various prompts
         has_more_prompt = '--more--' in output
-        attribute_increase_prompt = ('Increase (S)trength' in output or 
-                                     'Increase (S)trength, (I)ntelligence, or (D)exterity' in output)
-        save_game_prompt = 'save game and return to main menu' in output.lower()
+        # The full "Increase (S)trength, (I)ntelligence, or (D)exterity" prompt starts with this
+        attribute_increase_prompt = 'Increase (S)trength' in output
+        save_game_prompt = 'save game and return to main menu' in self._lower_clean(output)
         has_level_up = self.parser.has_level_up_message(output)
         
         # Check gameplay indicators
@@ -1558,8 +1934,6 @@ class DCSSBot:
             in_inventory_screen=in_inventory_screen,
             in_item_pickup_menu=in_item_pickup_menu,
             in_menu=in_menu,
-            equip_slot_pending=self.equip_slot is not None,
-            quaff_slot_pending=self.quaff_slot is not None,
             has_level_up=has_level_up,
             has_more_prompt=has_more_prompt,
             attribute_increase_prompt=attribute_increase_prompt,
@@ -1598,8 +1972,10 @@ class DCSSBot:
             command, reason = self.decision_engine.decide(context)
             
             if command is not None:
+                # Runs every tick, so the reason is set inline rather than via _return_action
                 self.engine_decisions_made += 1
-                return self._return_action(command, reason)
+                self.action_reason = reason
+                return command
             
             # Engine returned None - this should not happen with default engine
             # but provide a safe fallback
@@ -1638,10 +2014,9 @@ class DCSSBot:
         try:
             logger.info("Waiting for Crawl startup...")
             self._log_activity("Waiting for Crawl startup screen", "info")
-            time.sleep(4.0)
             
-            # Read initial menu
-            output = self.local_client.read_output(timeout=3.0)
+            # Read initial menu as soon as it settles (Crawl can take a few seconds to start)
+            output = self.local_client.read_output_stable(timeout=7.0, stability_threshold=0.5)
             if not output:
                 logger.error("No startup menu received!")
                 self._log_activity("No startup menu received!", "error")
@@ -1666,6 +2041,7 @@ class DCSSBot:
             # 1. Selects "Dungeon Crawl" as the default game type (we do NOT manually select it)
             # 2. Proceeds to character creation menus (race, class, background, etc.)
             max_startup_attempts = 50
+            send = self.local_client.send_command
             name_sent = False
             last_menu_state = None
             
@@ -1673,8 +2049,8 @@ class DCSSBot:
                 # On first iteration, use the initial output we already read
                 # On subsequent iterations, read new output
                 if attempt > 0:
-                    logger.debug(f"Attempt {attempt + 1}: Reading output with 2.0s timeout...")
-                    output = self.local_client.read_output(timeout=2.0)
+                    logger.debug(f"Attempt {attempt + 1}: Reading stable output with 3.5s timeout...")
+                    output = self.local_client.read_output_stable(timeout=3.5, stability_threshold=0.5)
                     clean = self._clean_ansi(output) if output else ""
                     if output:
                         self.last_screen = output
@@ -1691,11 +2067,12 @@ class DCSSBot:
                 
                 # Only process if we have output
                 if output:
-                    has_name_prompt = 'enter your name:' in clean.lower()
+                    clean_lower = self._lower_clean(output)
+                    has_name_prompt = 'enter your name:' in clean_lower
                     logger.debug(f"Startup phase {attempt + 1}: has_name_prompt={has_name_prompt}, name_sent={name_sent}")
-                    logger.debug(f"Output preview (first 200 chars): {clean[:200]}")
+                    logger.opt(lazy=True).debug("Output preview (first 200 chars): {}", lambda: clean[:200])
                     
-                    # Phase 1a: Name entry - send name characters one by one, then Enter
+                    # Phase 1a: Name entry - clear the prompt, then send the name and Enter in one write
                     if not name_sent and has_name_prompt:
                         logger.debug(f"Startup phase {attempt + 1}: MATCHED - name prompt")
                         name = self._generate_random_name()
@@ -1704,67 +2081,48 @@ class DCSSBot:
                         
                         # First, clear any pre-populated name from previous session using Ctrl+U (clear line)
                         # This deletes from cursor to start of line
-                        self.local_client.send_command('\x15')  # Ctrl+U
+                        send('\x15')  # Ctrl+U
                         time.sleep(0.1)
                         
-                        # Send name as individual keypresses in cbreak mode
-                        for char in name:
-                            self.local_client.send_command(char)
-                            time.sleep(0.05)  # Small delay between characters
-                        # Send Enter (\r\n for compatibility)
-                        self.local_client.send_command('\r\n')
+                        # Send the name and Enter (\r\n for compatibility) in one write; in cbreak
+                        # mode Crawl still reads the buffered bytes one keypress at a time
+                        send(name + '\r\n')
                         name_sent = True
-                        logger.debug(f"Name sent: {name}, sleeping 1.5s for character creation menu to appear...")
-                        time.sleep(1.5)
+                        logger.debug(f"Name sent: {name}, waiting for character creation menu to appear...")
                         continue  # Go to next iteration to read the response
                     
                     # After name submitted, handle character creation menus
                     if name_sent:
                         # Check if we've reached gameplay
-                        if 'Time:' in clean and len(clean) > 400:
+                        if len(clean) > 400 and 'Time:' in clean:
                             logger.info(f"✓ GAMEPLAY REACHED during startup on attempt {attempt + 1}!")
                             self._log_activity("Gameplay started!", "success")
                             self.last_screen = output
                             self.screen_buffer.update_from_output(output)
-                            self.parser.parse_output(output)  # Parse the screen to get correct health values
+                            self._parse_output(output)  # Parse the screen to get correct health values
                             self._display_tui_to_user("🎮 GAMEPLAY STARTED!")
                             return True
                         
-                        current_state = startup_state_machine.update(clean.lower())
+                        current_state = startup_state_machine.update(clean_lower)
                         logger.debug(f"Startup phase {attempt + 1}: CharCreation state = {current_state}")
-                        logger.debug(f"Output preview (first 150 chars): {clean[:150]}")
                         
                         # If we've transitioned to a new menu state (race, class, background, etc.)
                         if current_state != 'startup' and current_state != 'error' and current_state != last_menu_state:
                             # Save screenshot of the current menu before making a selection
-                            menu_screenshots = {
-                                'race': 'CHARACTER CREATION: Species Selection',
-                                'class_select': 'CHARACTER CREATION: Class Selection',
-                                'background': 'CHARACTER CREATION: Background Selection',
-                                'skills': 'CHARACTER CREATION: Skills/Equipment Selection',
-                            }
-                            screenshot_label = menu_screenshots.get(current_state, f'CHARACTER CREATION: {current_state}')
+                            screenshot_label = _MENU_SCREENSHOTS.get(current_state, f'CHARACTER CREATION: {current_state}')
                             self._save_debug_screen(output, screenshot_label)
                             
-                            # Determine which key to send based on the menu type
-                            selection_map = {
-                                'species': ('j', 'Human'),           # j = Human
-                                'class_select': ('a', 'Fighter'),  # a = Fighter (for background)
-                                'background': ('a', 'Fighter'),    # a = Fighter
-                                'skills': ('c', 'War Axe'),        # c = War Axe (weapon selection)
-                            }
-                            
-                            # Get the selection for this menu, default to 'a' if not found
-                            selection_key, selection_name = selection_map.get(current_state, ('a', 'first option'))
+                            # Determine which key to send based on the menu type,
+                            # default to 'a' if not found
+                            selection_key, selection_name = _SELECTION_MAP.get(current_state, ('a', 'first option'))
                             
                             logger.info(f"✓ Detected {current_state} menu - sending '{selection_key}' to select {selection_name}")
                             self._log_activity(f"Selecting {current_state}: '{selection_key}' ({selection_name})", "info")
                             self._display_tui_to_user(f"🎮 {current_state} menu - selecting {selection_name} ({selection_key})")
                             # Send the selection key
-                            self.local_client.send_command(selection_key)
+                            send(selection_key)
                             last_menu_state = current_state
-                            logger.debug(f"Sent '{selection_key}' command, sleeping 1.5s before reading next screen...")
-                            time.sleep(1.5)
+                            logger.debug(f"Sent '{selection_key}' command, reading next screen...")
                             continue
                         
                         # If still in startup state but got output, keep trying
@@ -1789,10 +2147,10 @@ class DCSSBot:
                 self._display_tui_to_user("Character creation phase - final attempt")
                 
                 # Last check for gameplay
-                if 'Time:' in clean and len(clean) > 400:
+                if len(clean) > 400 and 'Time:' in clean:
                     logger.info(f"✓ GAMEPLAY REACHED on final check!")
                     self._log_activity("Gameplay started!", "success")
-                    self.parser.parse_output(output)  # Parse the screen to get correct health values
+                    self._parse_output(output)  # Parse the screen to get correct health values
                     self._display_tui_to_user("🎮 GAMEPLAY STARTED!")
                     return True
             
@@ -1817,44 +2175,21 @@ class DCSSBot:
             return False
         
         clean = self._clean_ansi(output)
-        clean_lower = clean.lower()
+        clean_lower = self._lower_clean(output)
         
         # Check for game interface indicators (character was loaded)
-        game_indicators = [
-            'welcome back',
-            'welcome to',
-            'press ? for a list of commands',
-            'health:',  # Character stats
-            'magic:',
-            ' ac:',      # Note the space before AC to avoid 'place'
-            ' xp:',
-            ' ev:',
-            'dungeon:',
-            'dungeon level',
-            'exp:',
-        ]
-        
-        has_game_interface = any(phrase in clean_lower for phrase in game_indicators)
-        
-        # Additional check: look for dungeon visualization characters (#, ., +, etc.)
-        # This is pretty specific to DCSS
-        has_dungeon_chars = any(char in clean for char in ['#', '.', '+', '-', '|'])
-        
-        # Also check for the player position marker
-        has_player_marker = '@' in clean
-        
-        # Check if this is actually a menu (creation/selection menu)
-        is_menu = any(phrase in clean_lower for phrase in [
-            'choose a race',
-            'choose a class',
-            'choose your',
-            'enter a character name',
-            'choose a background',
-            'choose your abilities',
-        ])
+        has_game_interface = any(phrase in clean_lower for phrase in _GAME_INTERFACE_PHRASES)
+        
+        # Additional check: the player position marker plus dungeon visualization characters
+        # (#, ., +, etc.) is pretty specific to DCSS. Each is a single memchr scan, and none
+        # run once an interface phrase was found
+        has_map_view = (not has_game_interface and '@' in clean
+                        and any(char in clean for char in _DUNGEON_GLYPHS))
         
         # If we have game interface or dungeon chars/player marker AND NOT a menu, then character was loaded
-        character_loaded = (has_game_interface or (has_dungeon_chars and has_player_marker)) and not is_menu
+        # (the creation/selection menu phrases are only scanned when the first part holds)
+        character_loaded = ((has_game_interface or has_map_view)
+                            and not any(phrase in clean_lower for phrase in _CREATION_MENU_PHRASES))
         
         if character_loaded:
             logger.info("✓ Existing character detected - will play with this character")
@@ -1878,11 +2213,14 @@ class DCSSBot:
         """
         if not output:
             return []
+        # The detection, name and direction helpers all ask about the same screen
+        if output is self._tui_enemies_for:
+            return self._tui_enemies
         
-        clean = self._clean_ansi(output)
-        lines = clean.split('\n')
+        lines = self._clean_lines(output)
         
         enemies = []
+        monsters = []  # (map symbol, name) for each entry in enemies
         seen = set()  # Avoid duplicates
         
         # Parse the monsters section which starts at line 21 (0-indexed: line 20)
@@ -1893,7 +2231,8 @@ class DCSSBot:
         for line in lines:
             # First try to match the "grouped" format: multiple symbols + count + name
             # Pattern: [a-zA-Z]+ (symbols, 2+, upper or lower) + spaces + digits (count) + spaces + name (word chars only)
-            grouped_matches = re.finditer(r'([a-zA-Z]{2,})\s+(\d+)\s+(\w+)', line)
+            # (a digit search is a single C-level pass; most map rows have none)
+            grouped_matches = list(_GROUPED_MONSTER_RE.finditer(line)) if _DIGIT_RE.search(line) else []
             
             for match in grouped_matches:
                 symbols = match.group(1)
@@ -1904,47 +2243,67 @@ class DCSSBot:
                 # e.g., "Found 19 sling" has symbols="Found" (a message), not creatures
                 # Also reject common item names that appear in pickup messages like "here 16x arrows"
                 # Also reject equipment status messages like "Nothing quivered"
-                invalid_symbols = ['Found', 'You', 'The', 'This', 'That', 'Your', 'And', 'Are', 'But', 'Can', 'For', 'Have', 'Here', 'Just', 'Know', 'Like', 'Make', 'More', 'Now', 'Only', 'Out', 'Over', 'Some', 'Such', 'Take', 'Want', 'Way', 'What', 'When', 'Will', 'With', 'Would', 'have', 'here', 'Nothing']
-                if symbols in invalid_symbols:
+                if symbols in _NON_MONSTER_WORDS:
                     continue
                 
                 # Validate the entry
                 # Reject common items that might appear in "item found" messages
                 # Also reject common action keywords from equipment/message sections
-                item_keywords = ['arrow', 'dart', 'potion', 'scroll', 'ring', 'amulet', 'wand', 'staff', 'weapon', 'armour', 'armor', 'item', 'stone', 'food', 'poisoned', 'cursed', 'blessed', 'quivered']
-                if any(item in creature_name.lower() for item in item_keywords):
+                name_lower = creature_name.lower()
+                if any(item in name_lower for item in _NON_MONSTER_ITEM_WORDS):
                     continue
                     
                 if (creature_name and
-                    creature_name not in ['place', 'noise', 'time', 'ac', 'ev', 'sh', 'xl', 'next', 'magic', 'health', 'str', 'int', 'dex', 'a', 'o', 'b'] and
-                    not any(char in creature_name for char in '#.+=~,|-')):
+                    creature_name not in _STAT_PANEL_NAMES and
+                    _MAP_GLYPHS_IN_NAME.isdisjoint(creature_name)):
                     
                     # Add the creature once (we'll rely on the name to avoid duplicates)
                     if creature_name not in seen:
                         enemies.append(creature_name)
+                        monsters.append((symbols[0], creature_name))  # every symbol is the same glyph
                         seen.add(creature_name)
                         logger.debug(f"Monsters section (grouped): {symbols} ({count}x) -> {creature_name}")
             
             # Then try the standard format: single symbol + 3+ spaces + name
             # Only process if no grouped matches (avoid double-counting)
-            if not list(re.finditer(r'([a-zA-Z]{2,})\s+(\d+)\s+(\w+)', line)):
-                standard_matches = re.finditer(r'([a-zA-Z])\s{3,}([\w\s]+?)(?=\s{3,}[a-zA-Z]|\(|[│]|$)', line)
-                
-                for match in standard_matches:
+            if not grouped_matches:
+                for match in _STANDARD_MONSTER_RE.finditer(line):
                     creature_symbol = match.group(1)
                     creature_name = match.group(2).strip()
                     
                     if (creature_name and
                         creature_symbol not in '│─┌┐└┘┼├┤┬┴' and
-                        creature_name not in ['place', 'noise', 'time', 'ac', 'ev', 'sh', 'xl', 'next', 'magic', 'health', 'str', 'int', 'dex', 'a', 'o', 'b'] and
-                        not any(char in creature_name for char in '#.+=~,|-') and
+                        creature_name not in _STAT_PANEL_NAMES and
+                        _MAP_GLYPHS_IN_NAME.isdisjoint(creature_name) and
                         creature_name not in seen):
                         enemies.append(creature_name)
+                        monsters.append((creature_symbol, creature_name))
                         seen.add(creature_name)
                         logger.debug(f"Monsters section (standard): {creature_symbol} -> {creature_name}")
         
+        self._tui_enemies_for = output
+        self._tui_enemies = enemies
+        self._tui_monsters = monsters
         return enemies
 
+    def _extract_tui_monsters(self, output: str) -> list[tuple[str, str]]:
+        """
+        Return (map symbol, name) pairs for the enemies in the TUI monsters section.
+        
+        Same entries and order as _extract_all_enemies_from_tui, from the same
+        per-screen parse.
+        
+        Args:
+            output: Current game output
+            
+        Returns:
+            List of (symbol, enemy name) pairs, empty list if none
+        """
+        if not output:
+            return []
+        self._extract_all_enemies_from_tui(output)
+        return self._tui_monsters
+
     def _extract_enemy_name(self, output: str) -> str:
         """
         Extract the name of the detected enemy from the TUI display.
@@ -2030,8 +2389,7 @@ class DCSSBot:
             return None
         
         try:
-            clean = self._clean_ansi(output)
-            lines = clean.split('\n')
+            lines = self._clean_lines(output)
             
             # Find the enemy character from the TUI monsters section
             # The monsters section shows: "X   creature_name" where X is the map symbol
@@ -2041,8 +2399,9 @@ class DCSSBot:
                 if enemy_name in line:
                     # Extract the first character of the line as the symbol
                     # Pattern: "[a-zA-Z]\s{3,}name" = symbol with 3+ spaces then name
-                    match = re.search(r'^([a-zA-Z])\s{3,}' + re.escape(enemy_name), line)
-                    if match:
+                    # (one fixed pattern plus startswith, instead of a regex built per name)
+                    match = _MONSTER_ROW_SYMBOL_RE.match(line)
+                    if match and line.startswith(enemy_name, match.end()):
                         enemy_symbol = match.group(1)
                         logger.debug(f"Found enemy symbol '{enemy_symbol}' for {enemy_name}")
                         break
@@ -2058,19 +2417,25 @@ class DCSSBot:
             enemy_row = None
             enemy_col = None
             
-            for row_idx, line in enumerate(lines[:21]):  # Map is typically in first 21 lines
+            # Map is typically in first 21 lines (the monsters section comes after line 21).
+            # The lowest row holding each character wins, so walk the rows bottom-up and
+            # stop as soon as both are placed
+            for row_idx in range(min(len(lines), 21) - 1, -1, -1):
+                line = lines[row_idx]
                 # Find player (@)
-                if '@' in line:
-                    player_col = line.index('@')
-                    player_row = row_idx
+                if player_row is None:
+                    col = line.find('@')
+                    if col != -1:
+                        player_row, player_col = row_idx, col
                 
                 # Find enemy character
-                if enemy_symbol in line:
-                    # Make sure this is the map, not the monsters section
-                    # (monsters section is typically after line 21)
-                    if row_idx <= 20:
-                        enemy_col = line.index(enemy_symbol)
-                        enemy_row = row_idx
+                if enemy_row is None:
+                    col = line.find(enemy_symbol)
+                    if col != -1:
+                        enemy_row, enemy_col = row_idx, col
+                
+                if player_row is not None and enemy_row is not None:
+                    break
             
             if player_row is None or enemy_row is None:
                 logger.debug(f"Could not locate player or enemy on map (player: {player_row}, enemy: {enemy_row})")
@@ -2082,32 +2447,15 @@ class DCSSBot:
             
             logger.debug(f"Player at ({player_row}, {player_col}), Enemy at ({enemy_row}, {enemy_col}), diff: ({row_diff}, {col_diff})")
             
-            # Determine direction based on differences
-            # Prioritize horizontal/vertical over diagonal when one difference is much larger
+            # Determine direction based on differences: one step along each axis, but
+            # prioritize horizontal/vertical over diagonal when one difference is larger
+            dy = (row_diff > 0) - (row_diff < 0)
+            dx = (col_diff > 0) - (col_diff < 0)
             if abs(row_diff) > abs(col_diff):
-                # Vertical dominates
-                if row_diff > 0:
-                    return 'j'  # down
-                else:
-                    return 'k'  # up
+                dx = 0  # Vertical dominates
             elif abs(col_diff) > abs(row_diff):
-                # Horizontal dominates
-                if col_diff > 0:
-                    return 'l'  # right
-                else:
-                    return 'h'  # left
-            else:
-                # Diagonal - use appropriate diagonal key
-                if row_diff > 0:  # Down
-                    if col_diff > 0:
-                        return 'n'  # down-right
-                    else:
-                        return 'b'  # down-left
-                else:  # Up
-                    if col_diff > 0:
-                        return 'u'  # up-right
-                    else:
-                        return 'y'  # up-left
+                dy = 0  # Horizontal dominates
+            return _DIRECTION_KEYS[(dy + 1) * 3 + dx + 1]
         
         except Exception as e:
             logger.debug(f"Error calculating direction to enemy: {e}")
@@ -2133,15 +2481,12 @@ class DCSSBot:
         
         clean = self._clean_ansi(output)
         
-        # Check for characteristic shop patterns
+        # Check for characteristic shop patterns, rarest first so ordinary screens stop
+        # after a single scan
         # Primary check: "Welcome to" + "Shop!" is the most reliable indicator
-        has_welcome_line = 'Welcome to' in clean and "Shop!" in clean
-        
         # Secondary check: "[Esc] exit" command (present in shop interface)
-        has_esc_exit = "[Esc] exit" in clean
-        
         # If both patterns present, definitely in a shop
-        if has_welcome_line and has_esc_exit:
+        if "Shop!" in clean and "[Esc] exit" in clean and 'Welcome to' in clean:
             logger.info("🏪 Shop interface detected")
             return True
         
@@ -2167,50 +2512,34 @@ class DCSSBot:
         if not output:
             return '.'
         
-        # Get the enemy from TUI monsters section (not by scanning for lowercase)
+        # Get the enemy and its map symbol from TUI monsters section (not by scanning for lowercase)
         # This ensures we target the correct enemy, not UI artifacts
-        enemies_from_tui = self._extract_all_enemies_from_tui(output)
-        if not enemies_from_tui:
+        monsters = self._extract_tui_monsters(output)
+        if not monsters:
             logger.debug("No enemies in TUI monsters section")
             return '.'
-        
-        # We'll look for the enemy symbol on the map
-        # First, we need to get the creature symbol from somewhere
-        # The TUI monsters section shows "S   ball python", so we need to parse that
-        # Let's scan the output for the "X   name" pattern to get the symbol
-        
-        enemy_symbol = None
-        for line in output.split('\n'):
-            # Look for the monster entry format: "S   ball python"
-            # Match: single char + 3+ spaces + creature name
-            match = re.match(r'^([a-zA-Z])\s{3,}([\w\s]+)', line)
-            if match:
-                symbol, creature_name = match.groups()
-                creature_name_clean = creature_name.strip()
-                # Check if this is the enemy we're looking for (first one from TUI)
-                if creature_name_clean == enemies_from_tui[0]:
-                    enemy_symbol = symbol
-                    break
-        
-        if not enemy_symbol:
-            logger.debug(f"Could not find enemy symbol for {enemies_from_tui[0]}")
-            return '.'
+        enemy_symbol, enemy_name = monsters[0]
+        lines = self._clean_lines(output)
         
         # Now scan the map for this specific enemy symbol
-        lines = output.split('\n')
         player_pos = None
         enemy_pos = None
         
-        # Only scan the map area (rows 0-25, columns 0-79)
-        for y, line in enumerate(lines):
-            if y > 25:  # Map area ends around row 25-26
-                break
-            for x in range(min(80, len(line))):
-                char = line[x]
-                if char == '@':
+        # Only scan the map area (rows 0-25, columns 0-79). The last occurrence of each
+        # character wins, so search each row from the right, walking the rows bottom-up,
+        # and stop once both are placed
+        for y in range(min(len(lines), 26) - 1, -1, -1):  # Map area ends around row 25-26
+            line = lines[y]
+            if player_pos is None:
+                x = line.rfind('@', 0, 80)
+                if x != -1:
                     player_pos = (x, y)
-                elif char == enemy_symbol:
+            if enemy_pos is None:
+                x = line.rfind(enemy_symbol, 0, 80)
+                if x != -1:
                     enemy_pos = (x, y)
+            if player_pos and enemy_pos:
+                break
         
         if not player_pos or not enemy_pos:
             logger.debug(f"Could not find player or enemy '{enemy_symbol}' on map (player={player_pos}, enemy={enemy_pos})")
@@ -2223,24 +2552,11 @@ class DCSSBot:
         dx = 0 if enemy_x == player_x else (1 if enemy_x > player_x else -1)
         dy = 0 if enemy_y == player_y else (1 if enemy_y > player_y else -1)
         
-        # Map (dx, dy) to direction keys
-        direction_map = {
-            (-1, -1): 'y',  # up-left
-            (0, -1): 'k',   # up
-            (1, -1): 'u',   # up-right
-            (-1, 0): 'h',   # left
-            (0, 0): '.',    # on top (wait)
-            (1, 0): 'l',    # right
-            (-1, 1): 'b',   # down-left
-            (0, 1): 'j',    # down
-            (1, 1): 'n',    # down-right
-        }
-        
         distance = abs(enemy_x - player_x) + abs(enemy_y - player_y)
-        direction = direction_map.get((dx, dy), '.')
+        direction = _DIRECTION_KEYS[(dy + 1) * 3 + dx + 1]
         
-        logger.debug(f"Map scan found enemy '{enemy_symbol}' ({enemies_from_tui[0]}) at ({enemy_x}, {enemy_y}), player at ({player_x}, {player_y}), distance={distance}")
-        logger.info(f"🎯 Moving toward {enemy_symbol} {enemies_from_tui[0]} (distance: {distance}, direction: {direction})")
+        logger.debug(f"Map scan found enemy '{enemy_symbol}' ({enemy_name}) at ({enemy_x}, {enemy_y}), player at ({player_x}, {player_y}), distance={distance}")
+        logger.info(f"🎯 Moving toward {enemy_symbol} {enemy_name} (distance: {distance}, direction: {direction})")
         return self._return_action(direction, f"Moving toward {enemy_symbol}")
 
     def _print_final_stats(self) -> None:
@@ -2263,62 +2579,53 @@ class DCSSBot:
         final_total = (self.final_experience_level - 1) * 100 + self.final_experience_progress
         experience_gained = final_total - initial_total
         
-        # Helper function to print and log simultaneously
-        def print_and_log(message: str = "") -> None:
-            print(message)
-            logger.info(message)
-        
-        print_and_log("=== Final Statistics ===")
-        print_and_log(f"Moves: {self.move_count}")
-        print_and_log(f"Location: {final_location}")
-        print_and_log(f"Health: {final_health}/{final_max_health}")
-        print_and_log(f"Mana: {final_mana}/{final_max_mana}")
-        print_and_log(f"Experience Level: {state.experience_level} (Progress: {state.experience_progress}%)")
-        print_and_log(f"Gold: {final_gold}")
-        print_and_log(f"Hunger: {state.hunger_level}")
-        print_and_log("")
-        print_and_log("=== Experience Gained ===")
-        print_and_log(f"Initial: Level {self.initial_experience_level}, {self.initial_experience_progress}% progress")
-        print_and_log(f"Final:   Level {self.final_experience_level}, {self.final_experience_progress}% progress")
-        print_and_log(f"Total Experience Gained: {experience_gained}% (equivalent to {experience_gained / 100:.2f} levels)")
-        
-        print_and_log("")
-        print_and_log("=== Exploration Summary ===")
-        print_and_log(f"Total Moves: {self.move_count}")
-        print_and_log(f"Final Gold: {final_gold}")
-        print_and_log(f"Items Found: {len(self.items_found)}")
-        print_and_log(f"Unique Enemies Encountered: {len(self.enemies_encountered)}")
-        print_and_log(f"Total Events: {len(self.exploration_events)}")
+        # Each section is built as a list of lines; the report goes to stdout in one
+        # write and to the log as one record per section
+        sections = [[
+            "=== Final Statistics ===",
+            f"Moves: {self.move_count}",
+            f"Location: {final_location}",
+            f"Health: {final_health}/{final_max_health}",
+            f"Mana: {final_mana}/{final_max_mana}",
+            f"Experience Level: {state.experience_level} (Progress: {state.experience_progress}%)",
+            f"Gold: {final_gold}",
+            f"Hunger: {state.hunger_level}",
+        ], [
+            "=== Experience Gained ===",
+            f"Initial: Level {self.initial_experience_level}, {self.initial_experience_progress}% progress",
+            f"Final:   Level {self.final_experience_level}, {self.final_experience_progress}% progress",
+            f"Total Experience Gained: {experience_gained}% (equivalent to {experience_gained / 100:.2f} levels)",
+        ], [
+            "=== Exploration Summary ===",
+            f"Total Moves: {self.move_count}",
+            f"Final Gold: {final_gold}",
+            f"Items Found: {len(self.items_found)}",
+            f"Unique Enemies Encountered: {len(self.enemies_encountered)}",
+            f"Total Events: {sum(self.event_counts.values())}",
+        ]]
         
         # Show unique enemies encountered
         if self.enemies_encountered:
-            print_and_log("")
-            print_and_log("Enemies Encountered:")
-            for enemy in sorted(self.enemies_encountered):
-                print_and_log(f"  - {enemy}")
+            sections.append(["Enemies Encountered:"] + [f"  - {enemy}" for enemy in sorted(self.enemies_encountered)])
         
         # Show unique items found
         if self.items_found:
-            print_and_log("")
-            print_and_log("Items Found:")
-            for item in self.items_found[:10]:  # Show first 10
-                print_and_log(f"  - {item}")
+            section = ["Items Found:"] + [f"  - {item}" for item in self.items_found[:10]]  # Show first 10
             if len(self.items_found) > 10:
-                print_and_log(f"  ... and {len(self.items_found) - 10} more items")
+                section.append(f"  ... and {len(self.items_found) - 10} more items")
+            sections.append(section)
         
         # Show event log (summary)
-        if self.exploration_events:
-            print_and_log("")
-            print_and_log("Event Log (Summary - Key Events):")
-            # Group events by type
-            event_counts = {}
-            for move, event_type, description in self.exploration_events:
-                if event_type not in event_counts:
-                    event_counts[event_type] = 0
-                event_counts[event_type] += 1
-            
-            for event_type, count in sorted(event_counts.items()):
-                print_and_log(f"  - {event_type.title()}: {count} events")
+        if self.event_counts:
+            # Counted per type as events were logged (the event deque only keeps the recent ones)
+            sections.append(["Event Log (Summary - Key Events):"] +
+                            [f"  - {event_type.title()}: {count} events"
+                             for event_type, count in sorted(self.event_counts.items())])
+        
+        texts = ["\n".join(section) for section in sections]
+        print("\n\n".join(texts))
+        for text in texts:
+            logger.info(text)
         
         # Ensure all logs are flushed (loguru handles this automatically)
 
@@ -11,8 +11,9 @@ Architecture:
 - Priority: Lower priority value = higher importance (evaluated first)
 """
 
+from bisect import insort
 from typing import Optional, Callable, Any, List, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from loguru import logger
 
@@ -41,7 +42,7 @@ class Priority(Enum):
     LOW = 30          # Optional actions
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionContext:
     """Game state context for decision evaluation."""
     # Raw output (for legacy compatibility)
@@ -64,8 +65,6 @@ class DecisionContext:
     in_menu: bool
     
     # Flags
-    equip_slot_pending: bool
-    quaff_slot_pending: bool
     has_level_up: bool
     has_more_prompt: bool
     attribute_increase_prompt: bool
@@ -85,12 +84,15 @@ class DecisionContext:
     goto_state: Optional[str]
     goto_target_level: int
     
-    @property
-    def health_percentage(self) -> float:
+    # Derived state, computed once when the context is built
+    health_percentage: float = field(init=False)
+    
+    def __post_init__(self):
         """Calculate health percentage."""
         if self.max_health <= 0:
-            return 100.0
-        return (self.health / self.max_health) * 100
+            self.health_percentage = 100.0
+        else:
+            self.health_percentage = (self.health / self.max_health) * 100
 
 
 @dataclass
@@ -103,11 +105,13 @@ class Rule:
         priority: Priority.VALUE - lower values evaluated first
         condition: Function that takes DecisionContext and returns bool
         action: Function that takes DecisionContext and returns (command, reason)
+        enabled: False for placeholder rules that are registered but never evaluated
     """
     name: str
     priority: Priority
     condition: Callable[[DecisionContext], bool]
     action: Callable[[DecisionContext], tuple[str, str]]
+    enabled: bool = True
 
 
 class DecisionEngine:
@@ -122,11 +126,16 @@ class DecisionEngine:
     
     def __init__(self):
         """Initialize the decision engine with no rules."""
-        self.rules: List[Rule] = []
+        self.rules: List[Rule] = []  # In the order they were added
+        # Same rules kept in evaluation order, so decide() never sorts
+        self._sorted_rules: List[Rule] = []
     
     def add_rule(self, rule: Rule) -> 'DecisionEngine':
         """Add a rule to the engine. Returns self for chaining."""
         self.rules.append(rule)
+        if rule.enabled:
+            # Insert after any rules of equal priority, keeping the stable order sorted() gave
+            insort(self._sorted_rules, rule, key=lambda r: r.priority.value)
         return self
     
     def decide(self, context: DecisionContext) -> tuple[Optional[str], str]:
@@ -139,8 +148,8 @@ class DecisionEngine:
         Returns:
             (command, reason) tuple or (None, "") if no rules match
         """
-        # Sort rules by priority (lower priority value = higher importance)
-        sorted_rules = sorted(self.rules, key=lambda r: r.priority.value)
+        # Rules are kept sorted by priority (lower priority value = higher importance)
+        sorted_rules = self._sorted_rules
         
         logger.debug(f"Evaluating {len(sorted_rules)} rules in priority order")
         
@@ -170,22 +179,6 @@ def create_default_engine() -> DecisionEngine:
     
     # CRITICAL PRIORITY: Menu prompts and immediate threats
     
-    # Rule: Respond to equip slot prompt
-    engine.add_rule(Rule(
-        name="Equip slot prompt",
-        priority=Priority.CRITICAL,
-        condition=lambda ctx: ctx.equip_slot_pending,
-        action=lambda ctx: ("", "")  # Will be handled by caller with stored slot
-    ))
-    
-    # Rule: Respond to quaff slot prompt
-    engine.add_rule(Rule(
-        name="Quaff slot prompt",
-        priority=Priority.CRITICAL,
-        condition=lambda ctx: ctx.quaff_slot_pending,
-        action=lambda ctx: ("", "")  # Will be handled by caller with stored slot
-    ))
-    
     # Rule: Handle attribute increase prompt
     engine.add_rule(Rule(
         name="Attribute increase prompt",
@@ -283,7 +276,8 @@ def create_default_engine() -> DecisionEngine:
         name="Better armor available",
         priority=Priority.URGENT,
         condition=lambda ctx: False,  # Will be checked by caller with frequency
-        action=lambda ctx: ("", "")
+        action=lambda ctx: ("", ""),
+        enabled=False
     ))
     
     # Rule: Identify untested potions
@@ -291,7 +285,8 @@ def create_default_engine() -> DecisionEngine:
         name="Untested potions",
         priority=Priority.URGENT,
         condition=lambda ctx: False,  # Will be checked by caller with frequency
-        action=lambda ctx: ("", "")
+        action=lambda ctx: ("", ""),
+        enabled=False
     ))
     
     # NORMAL PRIORITY: Combat
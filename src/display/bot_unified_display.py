@@ -2,9 +2,41 @@
 
 import sys
 from collections import deque
+from itertools import islice
 from typing import Optional, List
-from datetime import datetime
 from loguru import logger
+from src.utils.clock import timestamp
+
+# Activity level indicators; unknown levels show as info
+_LEVEL_PREFIX = {
+    "success": "✓",
+    "warning": "⚠",
+    "error": "✗",
+    "debug": "⚙",
+    "info": "ℹ",
+}
+
+# Activity level colors; info and unknown levels are left uncolored
+_LEVEL_COLOR = {
+    "success": "\033[32m",  # Green
+    "warning": "\033[33m",  # Yellow
+    "error": "\033[31m",    # Red
+    "debug": "\033[36m",    # Cyan
+}
+
+# Longest message shown in the panel before it is cut to 115 characters plus "..."
+_PANEL_MESSAGE_WIDTH = 118
+
+# Horizontal rule above and below the activity panel
+_SEPARATOR = "-" * 120
+
+
+def _stderr_is_terminal() -> bool:
+    """Whether stderr is an interactive terminal, i.e. log output shares the TUI's screen."""
+    try:
+        return sys.stderr.isatty()
+    except (AttributeError, ValueError):
+        return False
 
 
 class UnifiedBotDisplay:
@@ -19,18 +51,30 @@ class UnifiedBotDisplay:
     # 12-line activity panel (adjustable)
     ACTIVITY_PANEL_HEIGHT = 12
     
-    def __init__(self, max_messages: int = 100):
+    def __init__(self, max_messages: int = 100, owns_terminal: Optional[bool] = None):
         """
         Initialize unified display.
         
         Args:
             max_messages: Maximum activity messages to keep in history
+            owns_terminal: Whether nothing else writes to the display's terminal.
+                Only then are unchanged game rows left in place between frames;
+                otherwise every frame clears and redraws. Defaults to True
+                unless stderr (where main.py sends the log sinks) is a terminal.
         """
+        # Entries are (plain message, panel line, full colored line), colored once when added
         self.activity_messages: deque = deque(maxlen=max_messages)
         self.last_move = 0
         self.last_action = ""
         self.current_state = ""
         self.health_info = ""
+        # Bumped on every activity change so callers can tell when a redraw is needed
+        self.activity_version = 0
+        # Game rows currently on the terminal (None forces a full redraw)
+        self._drawn_game_lines: Optional[List[str]] = None
+        if owns_terminal is None:
+            owns_terminal = not _stderr_is_terminal()
+        self.owns_terminal = owns_terminal
         
     def add_activity(self, message: str, level: str = "info") -> None:
         """
@@ -40,26 +84,21 @@ class UnifiedBotDisplay:
             message: Activity message to display
             level: Message level - "info", "debug", "warning", "error", "success"
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
         # Format message with level indicator
-        if level == "success":
-            prefix = "✓"
-            formatted_msg = f"[{timestamp}] {prefix} {message}"
-        elif level == "warning":
-            prefix = "⚠"
-            formatted_msg = f"[{timestamp}] {prefix} {message}"
-        elif level == "error":
-            prefix = "✗"
-            formatted_msg = f"[{timestamp}] {prefix} {message}"
-        elif level == "debug":
-            prefix = "⚙"
-            formatted_msg = f"[{timestamp}] {prefix} {message}"
-        else:  # info
-            prefix = "ℹ"
-            formatted_msg = f"[{timestamp}] {prefix} {message}"
+        prefix = _LEVEL_PREFIX.get(level, "ℹ")
+        formatted_msg = f"[{timestamp()}] {prefix} {message}"
         
-        self.activity_messages.append((formatted_msg, level))
+        # Color both renderings now so redraws just copy the strings
+        color = _LEVEL_COLOR.get(level)
+        colored_msg = f"{color}{formatted_msg}\033[0m" if color else formatted_msg
+        panel_msg = colored_msg
+        if len(formatted_msg) > _PANEL_MESSAGE_WIDTH:
+            # Truncate the text, not the escape codes, so the color reset is kept
+            truncated = formatted_msg[:_PANEL_MESSAGE_WIDTH - 3] + "..."
+            panel_msg = f"{color}{truncated}\033[0m" if color else truncated
+        
+        self.activity_messages.append((formatted_msg, panel_msg, colored_msg))
+        self.activity_version += 1
         logger.debug(f"Activity: {formatted_msg}")
     
     def display(self, visual_screen: str, move_count: int = 0, action: str = "", 
@@ -74,7 +113,7 @@ class UnifiedBotDisplay:
             state: Current game state
             health: Health/mana/level info string
         """
-        if not visual_screen or not visual_screen.strip():
+        if not visual_screen or visual_screen.isspace():
             return
         
         try:
@@ -84,10 +123,6 @@ class UnifiedBotDisplay:
             self.current_state = state
             self.health_info = health
             
-            # Clear screen
-            sys.stdout.write("\033[2J\033[H")
-            sys.stdout.flush()
-            
             # Calculate available space
             # Get terminal height
             try:
@@ -103,9 +138,22 @@ class UnifiedBotDisplay:
             game_lines = visual_screen.split('\n')
             game_lines = game_lines[-game_display_height:] if len(game_lines) > game_display_height else game_lines
             
-            # Display game output
-            sys.stdout.write("\033[0m")  # Reset colors
-            sys.stdout.write('\n'.join(game_lines))
+            # Log lines written to a shared terminal land in the game area: only skip
+            # unchanged rows when nothing else can have drawn over them
+            previous = self._drawn_game_lines if self.owns_terminal else None
+            if previous is None or len(previous) != len(game_lines):
+                # Layout changed (or terminal shared): clear screen and draw everything
+                sys.stdout.write("\033[2J\033[H")
+                sys.stdout.write("\033[0m")  # Reset colors
+                sys.stdout.write('\n'.join(game_lines))
+            else:
+                # Same layout: overwrite only the game rows that changed
+                for row, line in enumerate(game_lines):
+                    if line != previous[row]:
+                        sys.stdout.write(f"\033[{row + 1};1H\033[0m{line}\033[K")
+                # Park the cursor at the end of the game area for the panel below
+                sys.stdout.write(f"\033[{len(game_lines)};1H")
+            self._drawn_game_lines = game_lines
             sys.stdout.flush()
             
             # Display activity panel on a new line
@@ -118,48 +166,30 @@ class UnifiedBotDisplay:
     def _display_activity_panel(self) -> None:
         """Display the 12-line bot activity panel."""
         try:
-            # Panel header
+            # Build the whole panel, then write it in one call
+            # Every panel line ends with \033[K: the screen is not always cleared before drawing
             panel_header = f"BOT ACTIVITY ({len(self.activity_messages)} messages)"
-            sys.stdout.write(f"\033[0m\033[1;36m{panel_header}\033[0m\n")  # Bold cyan
-            
-            # Separator
-            sys.stdout.write("-" * 120 + "\n")
+            out = [
+                f"\033[0m\033[1;36m{panel_header}\033[0m\033[K\n",  # Bold cyan
+                f"{_SEPARATOR}\033[K\n",
+            ]
             
             # Get the last N messages to fit in panel
             # Account for header, separator, and top/bottom padding
             available_lines = self.ACTIVITY_PANEL_HEIGHT - 3
             
             # Get most recent messages
-            messages_to_show = list(self.activity_messages)[-available_lines:]
-            
-            # Pad with empty lines if needed
-            while len(messages_to_show) < available_lines:
-                messages_to_show.insert(0, ("", "info"))
-            
-            # Display messages with color coding
-            for msg, level in messages_to_show:
-                if msg:
-                    if level == "success":
-                        colored_msg = f"\033[32m{msg}\033[0m"  # Green
-                    elif level == "warning":
-                        colored_msg = f"\033[33m{msg}\033[0m"  # Yellow
-                    elif level == "error":
-                        colored_msg = f"\033[31m{msg}\033[0m"  # Red
-                    elif level == "debug":
-                        colored_msg = f"\033[36m{msg}\033[0m"  # Cyan
-                    else:  # info
-                        colored_msg = msg
-                    
-                    # Truncate to terminal width if needed
-                    if len(msg) > 118:
-                        colored_msg = colored_msg[:115] + "..."
-                    
-                    sys.stdout.write(f"{colored_msg}\n")
-                else:
-                    sys.stdout.write("\n")
+            messages_to_show = self._recent_messages(available_lines)
+            
+            # Pad with empty lines above the messages if needed
+            out.extend("\033[K\n" for _ in range(available_lines - len(messages_to_show)))
+            
+            # Display messages, already colored and truncated by add_activity
+            out.extend(f"{panel_msg}\033[K\n" for _, panel_msg, _ in messages_to_show)
             
             # Bottom separator
-            sys.stdout.write("-" * 120 + "\n")
+            out.append(f"{_SEPARATOR}\033[K\n")
+            sys.stdout.write("".join(out))
             sys.stdout.flush()
             
         except Exception as e:
@@ -171,34 +201,33 @@ class UnifiedBotDisplay:
         Useful when not showing game screen.
         """
         try:
-            sys.stdout.write("\033[2J\033[H")  # Clear and home
-            sys.stdout.flush()
+            self._drawn_game_lines = None  # Game area is wiped; next display() redraws fully
             
-            sys.stdout.write(f"\033[1;36mBOT ACTIVITY\033[0m\n")  # Bold cyan header
-            sys.stdout.write("-" * 120 + "\n")
+            out = [
+                "\033[2J\033[H",  # Clear and home
+                "\033[1;36mBOT ACTIVITY\033[0m\n",  # Bold cyan header
+                f"{_SEPARATOR}\n",
+            ]
             
             # Show last N messages
             available_lines = 30
-            messages_to_show = list(self.activity_messages)[-available_lines:]
-            
-            for msg, level in messages_to_show:
-                if level == "success":
-                    sys.stdout.write(f"\033[32m{msg}\033[0m\n")  # Green
-                elif level == "warning":
-                    sys.stdout.write(f"\033[33m{msg}\033[0m\n")  # Yellow
-                elif level == "error":
-                    sys.stdout.write(f"\033[31m{msg}\033[0m\n")  # Red
-                elif level == "debug":
-                    sys.stdout.write(f"\033[36m{msg}\033[0m\n")  # Cyan
-                else:
-                    sys.stdout.write(f"{msg}\n")
-            
-            sys.stdout.write("-" * 120 + "\n")
+            messages_to_show = self._recent_messages(available_lines)
+            
+            out.extend(f"{colored_msg}\n" for _, _, colored_msg in messages_to_show)
+            
+            out.append(f"{_SEPARATOR}\n")
+            sys.stdout.write("".join(out))
             sys.stdout.flush()
             
         except Exception as e:
             logger.error(f"Error displaying activity panel: {e}")
     
+    def _recent_messages(self, count: int) -> list:
+        """Last `count` activity entries, oldest first, without copying the whole history."""
+        recent = list(islice(reversed(self.activity_messages), count))
+        recent.reverse()
+        return recent
+    
     def get_activity_history(self, count: int = 50) -> List[str]:
         """
         Get recent activity messages.
@@ -210,8 +239,13 @@ class UnifiedBotDisplay:
             List of recent activity messages
         """
         messages = list(self.activity_messages)[-count:]
-        return [msg for msg, _ in messages]
+        return [msg for msg, _, _ in messages]
     
     def clear_activity(self) -> None:
         """Clear all activity messages."""
         self.activity_messages.clear()
+        self.activity_version += 1
+    
+    def invalidate(self) -> None:
+        """Force the next display() call to clear the terminal and redraw everything."""
+        self._drawn_game_lines = None
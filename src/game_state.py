@@ -6,6 +6,40 @@ from dataclasses import dataclass, field
 from loguru import logger
 
 
+# Status line patterns match the exact casing DCSS emits, so no re.IGNORECASE
+_HP_PATTERNS = (
+    re.compile(r'Health[:\s]+(\d+)/(\d+)'),  # Health: 23/23 or Health 23/23
+    re.compile(r'HP[:\s]+(\d+)/(\d+)'),      # HP: 23/23 or HP 23/23
+    re.compile(r'(\d+)/(\d+)\s+[Hh][Pp]'),   # 23/23 hp (alternate format)
+)
+_MANA_PATTERNS = (
+    re.compile(r'Magic\s+(\d+)/(\d+)'),
+    re.compile(r'MP[:\s]+(\d+)/(\d+)'),
+    re.compile(r'(\d+)/(\d+)\s+[Mm][Pp]'),
+)
+_XL_RE = re.compile(r'XL:\s*(\d+)')
+_NEXT_RE = re.compile(r'Next:\s*(\d+)%')
+_GOLD_RE = re.compile(r'Gold:\s*(\d+)')
+# ANSI escapes: CSI sequences (parameter/intermediate bytes, then one final byte), and
+# charset selection (ESC ( X). Explicit byte classes let the engine scan each sequence
+# linearly instead of trying the lazy quantifier's end condition at every character.
+_ANSI_RE = re.compile(r'\x1b\[[\x20-\x3f]*[\x40-\x7e]|\x1b\([B0UK]')
+# Longer phrases first so "Very Hungry" is not reported as plain "hungry"
+_HUNGER_RE = re.compile(
+    r'[Ee]ngorged|[Vv]ery [Hh]ungry|[Nn]ear [Ss]tarving|[Ss]tarving'
+    r'|[Ss]atisfied|[Hh]ungry|[Ff]ull'
+)
+# Game-over messages; plain substring checks beat a regex alternation on a full screen
+_GAME_OVER_PHRASES = (
+    'You are dead',
+    'You die',
+    'You have escaped',
+    'Well done!',
+    'Congratulations',
+    'you have won',  # More specific end-game phrase
+)
+
+
 @dataclass
 class Position:
     """Player position on the map."""
@@ -128,8 +162,11 @@ class GameStateParser:
         Remove ANSI escape sequences from text using regex.
         
         Strips color codes, cursor movement, and other terminal control sequences.
+        Text without any ESC byte (e.g. rendered screen buffer text) is returned as-is.
         """
-        return re.sub(r'\x1b\[[^\x1b]*?[a-zA-Z]|\x1b\([B0UK]', '', text)
+        if '\x1b' not in text:
+            return text
+        return _ANSI_RE.sub('', text)
 
     def _parse_line(self, line: str) -> bool:
         """
@@ -168,13 +205,8 @@ class GameStateParser:
             self.state.dungeon_level = int(branch_match.group(2))
         
         # Extract HP (handle various formats) - MORE LENIENT NOW
-        hp_patterns = [
-            r'Health[:\s]+(\d+)/(\d+)',  # Health: 23/23 or Health 23/23
-            r'HP[:\s]+(\d+)/(\d+)',      # HP: 23/23 or HP 23/23
-            r'(\d+)/(\d+)\s+hp',         # 23/23 hp (alternate format)
-        ]
-        for pattern in hp_patterns:
-            hp_match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _HP_PATTERNS:
+            hp_match = pattern.search(line)
             if hp_match:
                 self.state.health = int(hp_match.group(1))
                 self.state.max_health = int(hp_match.group(2))
@@ -182,13 +214,8 @@ class GameStateParser:
                 break
         
         # Extract Magic/Mana
-        mana_patterns = [
-            r'Magic\s+(\d+)/(\d+)',
-            r'MP[:\s]+(\d+)/(\d+)',
-            r'(\d+)/(\d+)\s+mp',
-        ]
-        for pattern in mana_patterns:
-            mana_match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _MANA_PATTERNS:
+            mana_match = pattern.search(line)
             if mana_match:
                 self.state.mana = int(mana_match.group(1))
                 self.state.max_mana = int(mana_match.group(2))
@@ -196,27 +223,25 @@ class GameStateParser:
                 break
         
         # Extract experience level (XL)
-        exp_match = re.search(r'XL:\s*(\d+)', line, re.IGNORECASE)
+        exp_match = _XL_RE.search(line)
         if exp_match:
             self.state.experience_level = int(exp_match.group(1))
             logger.debug(f"Parsed XL: {self.state.experience_level}")
         
         # Extract experience progress (Next: X%)
-        exp_progress_match = re.search(r'Next:\s*(\d+)%', line, re.IGNORECASE)
+        exp_progress_match = _NEXT_RE.search(line)
         if exp_progress_match:
             self.state.experience_progress = int(exp_progress_match.group(1))
         
         # Extract gold
-        gold_match = re.search(r'Gold:\s*(\d+)', line, re.IGNORECASE)
+        gold_match = _GOLD_RE.search(line)
         if gold_match:
             self.state.gold = int(gold_match.group(1))
         
         # Extract hunger status
-        hunger_keywords = ['engorged', 'full', 'satisfied', 'hungry', 'very hungry', 'near starving', 'starving']
-        for hunger in hunger_keywords:
-            if hunger in line.lower():
-                self.state.hunger_level = hunger
-                break
+        hunger_match = _HUNGER_RE.search(line)
+        if hunger_match:
+            self.state.hunger_level = hunger_match.group(0).lower()
         
         self.state.status_line = line
         logger.debug(f"Parsed status line: {line[:80]}...")
@@ -263,14 +288,10 @@ class GameStateParser:
         opening flavor text ("You feel drawn to the Orb of Zot..."), so we check
         for more specific ending phrases only.
         """
-        return any(phrase in output for phrase in [
-            'You are dead',
-            'You die',
-            'You have escaped',
-            'Well done!',
-            'Congratulations',
-            'you have won'  # More specific end-game phrase
-        ])
+        for phrase in _GAME_OVER_PHRASES:
+            if phrase in output:
+                return True
+        return False
     
     def has_level_up_message(self, output: str) -> bool:
         """
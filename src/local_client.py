@@ -4,6 +4,7 @@ import subprocess
 import time
 import threading
 import select
+import selectors
 import pty
 import os
 from typing import Optional
@@ -28,6 +29,9 @@ class LocalCrawlClient:
         self.output_buffer = ""
         self.read_thread = None
         self.stop_reading = False
+        # Reusable PTY read buffer (avoids a fresh bytes object per os.read)
+        self._read_buf = bytearray(65536)
+        self._read_mv = memoryview(self._read_buf)
 
     def connect(self) -> bool:
         """
@@ -92,6 +96,9 @@ class LocalCrawlClient:
                 shell=True
             )
             
+            # Non-blocking stdout so a read drains whatever is buffered and stops
+            os.set_blocking(self.process.stdout.fileno(), False)
+            
             self.process_fd = None
             logger.info("Successfully started local Crawl process with pipes")
             return True
@@ -179,7 +186,7 @@ class LocalCrawlClient:
 
     def _read_output_pty(self, timeout: float = 1.0) -> str:
         """Read output from PTY file descriptor."""
-        output = ""
+        parts = []
         try:
             start_time = time.time()
             while time.time() - start_time < timeout:
@@ -190,10 +197,10 @@ class LocalCrawlClient:
                     # but continue looping until full timeout is reached if no data available
                     ready = select.select([self.process_fd], [], [], min(remaining, 0.5))
                     if ready[0]:
-                        data = os.read(self.process_fd, 4096)
-                        if not data:
+                        n = os.readv(self.process_fd, [self._read_mv])
+                        if not n:
                             break
-                        output += data.decode('utf-8', errors='ignore')
+                        parts.append(bytes(self._read_mv[:n]))
                         time.sleep(0.05)
                     # If no data ready, continue looping instead of breaking
                     # The while condition will exit when timeout is reached
@@ -202,59 +209,41 @@ class LocalCrawlClient:
         except Exception as e:
             logger.debug(f"PTY read error: {e}")
         
-        return output
+        return b"".join(parts).decode('utf-8', errors='ignore')
 
     def _read_output_pipes(self, timeout: float = 1.0) -> str:
-        """Read output from subprocess pipes."""
+        """Read output from subprocess pipes.
+        
+        Waits once (up to timeout) for stdout to become readable, then drains
+        everything currently available from the non-blocking descriptor.
+        """
         if not self.process or not self.process.stdout:
             return ""
 
-        output = ""
+        parts = []
         try:
-            start_time = time.time()
-            max_iterations = 20  # Increased from 10 for more attempts
-            iterations = 0
-            got_any_data = False
-            total_wait = 0
+            fd = self.process.stdout.fileno()
+            with selectors.DefaultSelector() as sel:
+                sel.register(fd, selectors.EVENT_READ)
+                if not sel.select(timeout):
+                    logger.debug("read_output: no data within timeout")
+                    return ""
 
-            while iterations < max_iterations:
-                iterations += 1
-                elapsed = time.time() - start_time
-                remaining = max(0.01, timeout - elapsed)
-
-                if remaining <= 0.01:
-                    logger.debug(f"read_output timeout reached after {iterations} iterations, got {len(output)} bytes")
-                    break
-
-                # Use select to check if data is available (Unix/Linux only)
+            while True:
                 try:
-                    # Use longer select timeout to wait for data
-                    ready = select.select([self.process.stdout], [], [], min(remaining, 1.0))
-                    if ready[0]:
-                        # Data is available
-                        chunk_data = self.process.stdout.read(4096)
-                        if not chunk_data:
-                            logger.debug("Process stdout closed")
-                            break
-                        output += chunk_data.decode('utf-8', errors='ignore')
-                        got_any_data = True
-                        logger.debug(f"read_output iteration {iterations}: got {len(chunk_data)} bytes (total: {len(output)})")
-                        # Wait a bit for any additional buffered data
-                        time.sleep(0.1)  # Increased from 0.05 to give more time
-                    else:
-                        # select timed out - no more data coming right now
-                        if got_any_data:
-                            logger.debug(f"read_output: select timeout after getting data, returning {len(output)} bytes")
-                        break
-                except Exception as e:
-                    logger.debug(f"select/read error: {e}")
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    break  # Drained everything available right now
+                if not chunk:
+                    logger.debug("Process stdout closed")
                     break
+                parts.append(chunk)
 
         except Exception as e:
             logger.debug(f"read_output error: {e}")
 
-        if not output:
-            logger.debug(f"read_output returning empty after {iterations} iterations")
+        output = b"".join(parts).decode('utf-8', errors='ignore')
+        logger.debug(f"read_output: got {len(output)} bytes")
         return output
 
     def read_output_stable(self, timeout: float = 3.0, stability_threshold: float = 0.3) -> str:
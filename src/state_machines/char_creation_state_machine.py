@@ -31,6 +31,11 @@ class MenuTransitionPattern:
     case_sensitive: bool = False
     match_all: bool = False  # If True, ALL patterns must match. If False, ANY pattern matching is sufficient.
     
+    def __post_init__(self):
+        """Lower-case and compile the patterns once instead of on every match."""
+        patterns = self.patterns if self.case_sensitive else [p.lower() for p in self.patterns]
+        self._compiled = [re.compile(p) for p in patterns] if self.is_regex else patterns
+    
     def matches(self, text: str) -> bool:
         """Check if text matches pattern(s).
         
@@ -39,32 +44,13 @@ class MenuTransitionPattern:
         """
         test_text = text if self.case_sensitive else text.lower()
         
-        if self.match_all:
-            # AND logic: all patterns must match
-            for pattern in self.patterns:
-                pattern_to_check = pattern if self.case_sensitive else pattern.lower()
-                
-                if self.is_regex:
-                    if not re.search(pattern_to_check, test_text):
-                        return False
-                else:
-                    if pattern_to_check not in test_text:
-                        return False
-            
-            return True
+        if self.is_regex:
+            found = (regex.search(test_text) for regex in self._compiled)
         else:
-            # OR logic: any pattern matching is sufficient
-            for pattern in self.patterns:
-                pattern_to_check = pattern if self.case_sensitive else pattern.lower()
-                
-                if self.is_regex:
-                    if re.search(pattern_to_check, test_text):
-                        return True
-                else:
-                    if pattern_to_check in test_text:
-                        return True
-            
-            return False
+            found = (pattern in test_text for pattern in self._compiled)
+        
+        # all() stops at the first miss (AND logic), any() at the first hit (OR logic)
+        return all(found) if self.match_all else any(found)
 
 
 class CharacterCreationStateMachine(StateMachine):
@@ -0,0 +1,42 @@
+"""Cheap wall-clock timestamps for per-move logging."""
+
+import time
+
+# Last whole second formatted, and its HH:MM:SS text
+_cached_second = -1
+_cached_hms = ""
+
+
+def _hms(second: int) -> str:
+    """HH:MM:SS for a whole epoch second, formatted only when the second changes."""
+    global _cached_second, _cached_hms
+    if second != _cached_second:
+        _cached_hms = time.strftime("%H:%M:%S", time.localtime(second))
+        _cached_second = second
+    return _cached_hms
+
+
+def timestamp() -> str:
+    """
+    Current local time as HH:MM:SS, sharing timestamp_ms()'s per-second cache.
+
+    Returns:
+        Timestamp string, e.g. "14:03:27"
+    """
+    return _hms(int(time.time()))
+
+
+def timestamp_ms() -> str:
+    """
+    Current local time as HH:MM:SS.mmm.
+
+    The HH:MM:SS part is formatted with strftime at most once per second and
+    reused for every call within that second; only the milliseconds change.
+
+    Returns:
+        Timestamp string, e.g. "14:03:27.512"
+    """
+    # Round to microseconds first, as datetime does, so ".1" seconds prints as 100 not 099
+    micros = round(time.time() * 1_000_000)
+    second, fraction = divmod(micros, 1_000_000)
+    return f"{_hms(second)}.{fraction // 1000:03d}"
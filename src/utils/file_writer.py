@@ -0,0 +1,131 @@
+"""Background file writer so debug captures never block the bot's decision loop."""
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+from loguru import logger
+
+
+class BackgroundFileWriter:
+    """
+    Writes text files on a daemon thread, in submission order.
+
+    Besides plain file writes, arbitrary jobs can be queued with submit() so
+    formatting work (ANSI cleaning, box drawing) also happens off the caller's
+    thread. write() and submit() never block. With a maxsize, offer() drops
+    its job once that many jobs are pending, so optional output cannot pile
+    up behind a slow disk. The worker thread is started lazily on the first
+    job, so creating a writer (e.g. in tests) costs nothing until something
+    is actually queued. Call close() before exiting to flush everything
+    still pending.
+    """
+
+    _STOP = object()
+
+    def __init__(self, buffering: int = 1 << 16, maxsize: int = 0):
+        """
+        Initialize the writer.
+
+        Args:
+            buffering: Buffer size used when opening each file
+            maxsize: Pending jobs at which offer() starts dropping (0 for no limit)
+        """
+        self.buffering = buffering
+        self.maxsize = maxsize
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def write(self, path: str, text: str, mode: str = 'w') -> None:
+        """
+        Queue text to be written to path.
+
+        Args:
+            path: Destination file path
+            text: Complete file contents (or text to append when mode is 'a')
+            mode: File open mode, 'w' to replace or 'a' to append
+        """
+        self.submit(self._write_file, path, text, mode)
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Queue func(*args) to run on the worker thread.
+
+        Jobs run one at a time in submission order, so a job may safely use
+        file handles that only other jobs touch. Exceptions are logged and
+        do not stop the worker.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+        """
+        self._ensure_started()
+        self._queue.put((func, args))
+
+    def offer(self, func: Callable[..., Any], *args: Any) -> bool:
+        """
+        Queue func(*args) like submit(), but drop it if maxsize jobs are pending.
+
+        Use this for output that is nice to have but must never stall the
+        caller, such as per-move debug captures.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+
+        Returns:
+            True if the job was queued, False if it was dropped
+        """
+        self._ensure_started()
+        if self.maxsize and self._queue.qsize() >= self.maxsize:
+            return False
+        self._queue.put((func, args))
+        return True
+
+    def flush(self) -> None:
+        """Block until every queued write has been performed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Flush pending writes and stop the worker thread.
+
+        Args:
+            timeout: Maximum time to wait for the worker to finish
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._queue.put(self._STOP)
+        thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        """Start the worker thread if it is not running yet."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="debug-file-writer", daemon=True)
+                self._thread.start()
+
+    def _write_file(self, path: str, text: str, mode: str) -> None:
+        """Write text to path (runs on the worker thread)."""
+        with open(path, mode, encoding='utf-8', buffering=self.buffering) as f:
+            f.write(text)
+
+    def _run(self) -> None:
+        """Worker loop: run queued jobs until the stop sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                func, args = item
+                func(*args)
+            except Exception as e:
+                logger.debug(f"Background write failed: {e}")
+            finally:
+                self._queue.task_done()
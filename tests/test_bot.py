@@ -213,3 +213,750 @@ class TestLoginSequence:
         # Should detect gameplay state
         assert state_machine.current_state.id == 'gameplay', \
             f"Expected gameplay state, got {state_machine.current_state.id}"
+
+
+class TestCleanAnsi:
+    """Tests for ANSI escape stripping in DCSSBot._clean_ansi."""
+    
+    def test_strips_color_cursor_and_charset_sequences(self, mock_local_client):
+        """Test that SGR, cursor movement, private modes and charset selects are removed."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        raw = "\x1b[1;31mHealth:\x1b[0m 20/20\x1b[5;10H\x1b[?25h\x1b(B done"
+        assert bot._clean_ansi(raw) == "Health: 20/20 done"
+    
+    def test_non_letter_final_byte_does_not_eat_text(self, mock_local_client):
+        """Test that CSI sequences ending in '~' stop at the final byte."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        assert bot._clean_ansi("\x1b[2~abc") == "abc"
+    
+    def test_cached_result_tracks_latest_input(self, mock_local_client):
+        """Test that the one-slot cache returns fresh results when the input changes."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        assert bot._clean_ansi("\x1b[32ma\x1b[0m") == "a"
+        assert bot._clean_ansi("\x1b[32ma\x1b[0m") == "a"
+        assert bot._clean_ansi("\x1b[32mb\x1b[0m") == "b"
+        assert bot._clean_ansi("") == ""
+
+
+class TestExplorationEvents:
+    """Tests for DCSSBot._detect_exploration_events."""
+    
+    def test_gold_takes_priority_over_later_messages(self, mock_local_client):
+        """Test that gold is logged even when an item message appears first."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        bot._detect_exploration_events("You see a dagger.\nFound 12 gold pieces")
+        
+        assert bot.gold_found == 12
+        assert [e[1] for e in bot.exploration_events] == ['gold']
+        assert bot.items_found == []
+    
+    def test_item_logged_once(self, mock_local_client):
+        """Test that the same item is only recorded once."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        bot._detect_exploration_events("You see a +0 dagger.")
+        bot._detect_exploration_events("You see a +0 dagger.")
+        
+        assert bot.items_found == ['a +0 dagger']
+        assert len(bot.exploration_events) == 1
+    
+    def test_encounter_only_logs_creatures(self, mock_local_client):
+        """Test that encounters are filtered to known creature words."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        bot._detect_exploration_events("You encounter a giant rat.")
+        bot._detect_exploration_events("You encounter 2 kobolds, hmm")
+        bot._detect_exploration_events("You encounter a strange machine.")
+        
+        assert bot.enemies_encountered == {'a giant rat', '2 kobolds'}
+    
+    def test_compound_creature_names_logged(self, mock_local_client):
+        """Test that creature words inside longer names (hobgoblin, dragonfly) still count as enemies."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        bot._detect_exploration_events("You encounter a hobgoblin.")
+        bot._detect_exploration_events("You encounter a dragonfly.")
+        bot._detect_exploration_events("You encounter an Orc warrior.")
+        
+        assert bot.enemies_encountered == {'a hobgoblin', 'a dragonfly', 'an Orc warrior'}
+    
+    def test_feature_detection(self, mock_local_client):
+        """Test that dungeon features are logged by type."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        bot._detect_exploration_events("There is a stone staircase down and an open door nearby")
+        
+        assert bot.exploration_events[-1][1:] == ('feature', 'Found door')
+    
+    def test_screen_without_triggers_skips_scan(self, mock_local_client):
+        """Test that the event regex is not run when no trigger text is on screen."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        with patch('src.bot._EVENT_RE') as event_re:
+            bot._detect_exploration_events("#....@....#\nHealth: 10/10")
+            event_re.finditer.assert_not_called()
+        
+        assert len(bot.exploration_events) == 0
+    
+    def test_event_log_is_bounded(self, mock_local_client):
+        """Test that old events are evicted while per-type counts cover the whole session."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.exploration_events = type(bot.exploration_events)(maxlen=3)
+        
+        for i in range(5):
+            bot._log_event('gold', f"Found {i} gold")
+        bot._log_event('enemy', "Encountered: a rat")
+        
+        assert [e[2] for e in bot.exploration_events] == ["Found 3 gold", "Found 4 gold", "Encountered: a rat"]
+        assert bot.event_counts == {'gold': 5, 'enemy': 1}
+
+
+class TestBotScreenBuffer:
+    """Tests for the dirty-line cache in src.bot.ScreenBuffer."""
+    
+    def _reference_text(self, output: str) -> str:
+        import pyte
+        screen = pyte.Screen(160, 40)
+        pyte.Stream(screen).feed(output)
+        lines = [line.rstrip() for line in screen.display]
+        while lines and not lines[-1]:
+            lines.pop()
+        return '\n'.join(lines)
+    
+    def test_matches_full_pyte_render(self):
+        """Test that incremental updates render the same text as pyte's display."""
+        from src.bot import ScreenBuffer
+        buffer = ScreenBuffer()
+        chunks = [GAMEPLAY_SCREEN, "\x1b[5;5Hhello\x1b[K", "\x1b[2J\x1b[Hwide 中 char\r\n", "\n" * 45]
+        
+        fed = ""
+        for chunk in chunks:
+            buffer.update_from_output(chunk)
+            fed += chunk
+            assert buffer.get_screen_text() == self._reference_text(fed)
+    
+    def test_version_only_changes_with_content(self):
+        """Test that the version counter and memoized text survive empty updates."""
+        from src.bot import ScreenBuffer
+        buffer = ScreenBuffer()
+        buffer.update_from_output("abc")
+        version = buffer.version
+        text = buffer.get_screen_text()
+        
+        buffer.update_from_output("")
+        assert buffer.version == version
+        assert buffer.get_screen_text() is text
+        
+        buffer.update_from_output("d")
+        assert buffer.version == version + 1
+        assert buffer.get_screen_text() == "abcd"
+        
+        # Repainting the same text over itself is not a change
+        buffer.update_from_output("\x1b[1;1Habcd")
+        assert buffer.version == version + 1
+    
+    def test_message_log_matches_layout_parser(self):
+        """Test that the buffer's message log rows are the ones DCSSLayoutParser picks."""
+        from src.bot import ScreenBuffer
+        from src.tui_parser import DCSSLayoutParser
+        buffer = ScreenBuffer()
+        buffer.update_from_output(GAMEPLAY_SCREEN)
+        buffer.update_from_output("\x1b[3;1H_separator\x1b[30;1HFound 7 gold pieces.\x1b[32;1HYou see a dagger.")
+        
+        areas = DCSSLayoutParser().parse_layout(buffer.get_screen_text())
+        assert buffer.get_message_log_text() == areas['message_log'].get_text()
+        assert "Found 7 gold pieces." in buffer.get_message_log_text()
+        
+        buffer.update_from_output("\x1b[33;1HYou encounter a rat.")
+        assert buffer.get_message_log_text().endswith("You encounter a rat.")
+    
+    def test_buffer_uses_slots(self):
+        """Test that ScreenBuffer has no per-instance __dict__."""
+        from src.bot import ScreenBuffer
+        buffer = ScreenBuffer()
+        assert not hasattr(buffer, '__dict__')
+        with pytest.raises(AttributeError):
+            buffer.unexpected = 1
+
+
+class TestTuiLayoutCache:
+    """Tests for the per-version TUI layout cache."""
+    
+    def test_layout_parsed_once_per_screen_version(self, mock_local_client):
+        """Test that repeated lookups reuse the parse until the buffer changes."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.screen_buffer.update_from_output(GAMEPLAY_SCREEN)
+        
+        with patch.object(bot._tui_parser, 'parse_layout', wraps=bot._tui_parser.parse_layout) as parse:
+            first = bot._get_tui_areas()
+            assert bot._get_tui_areas() is first
+            assert parse.call_count == 1
+            
+            bot.screen_buffer.update_from_output("\x1b[1;1HX")
+            bot._get_tui_areas()
+            assert parse.call_count == 2
+    
+    def test_level_up_recorded_from_message_log(self, mock_local_client):
+        """Test that a level-up message in the buffer is recorded once."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        screen = "\n" * 30 + "You have reached level 2!"
+        bot.screen_buffer.update_from_output(screen.replace("\n", "\r\n"))
+        bot.last_screen = screen
+        
+        bot._detect_exploration_events(screen)
+        bot._detect_exploration_events(screen)
+        
+        assert bot.level_ups_gained == [2]
+
+
+class TestMenuDetection:
+    """Tests for character creation menu detection and option choice."""
+    
+    @pytest.mark.parametrize("screen, expected", [
+        ("Please select your species.", 'race'),
+        ("Select your class: fighter, gladiator", 'class'),
+        ("You have a choice of weapons:", 'weapons'),
+        ("Background: choose background", 'background'),
+        ("Skill aptitudes", 'skills'),
+        ("Select your difficulty", 'difficulty'),
+        ("Abil: Ability scores", 'abilities'),
+        ("Species: ... Which class", 'race'),  # race has priority over class
+        ("Nothing to see here", 'unknown'),
+        ("#..@..# HP: 10/10 Select your class", 'unknown'),  # dungeon map wins over phrases
+        ("Species: Human @ player", 'unknown'),  # '@' plus a space reads as the map
+    ])
+    def test_detect_menu_type(self, mock_local_client, screen, expected):
+        """Test that each menu type is detected from its phrases, by priority."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        assert bot._detect_menu_type(screen) == expected
+    
+    def test_weapon_choice_prefers_war_axe(self, mock_local_client):
+        """Test that 'war axe' wins over a plain axe even though both phrases overlap."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        assert bot._choose_menu_option("a - hand axe  b - War Axe", 'weapons') == 'w'
+        assert bot._choose_menu_option("a - hand axe  b - spear", 'weapons') == 'a'
+        assert bot._choose_menu_option("Gnoll, Human", 'race') == 'g'
+        assert bot._choose_menu_option("Human, Elf", 'race') == 'h'
+    
+    def test_choice_fallbacks(self, mock_local_client):
+        """Test default choices for menus without preferences and None for unknown menus."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        assert bot._choose_menu_option("a - Fighter", 'class') == 'f'
+        assert bot._choose_menu_option("a - Wizard", 'class') == 'a'
+        assert bot._choose_menu_option("a - Normal", 'difficulty') == 'a'
+        assert bot._choose_menu_option("a - Normal", 'mystery') is None
+
+    @pytest.mark.parametrize("screen, expected", [
+        ("Health: 10/10  Magic: 3/3", True),
+        ("#..@..#", True),  # map view without interface phrases
+        ("@ alone", False),  # player marker needs a dungeon glyph too
+        ("#..@..# Choose a race", False),  # creation menus always win
+        ("", False),
+    ])
+    def test_has_existing_character(self, mock_local_client, screen, expected):
+        """Test that a loaded game is told apart from the creation menus."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        assert bot._has_existing_character(screen) is expected
+
+
+class TestCleanAnsiFastPath:
+    """Tests for the escape-free fast path in DCSSBot._clean_ansi."""
+    
+    def test_plain_text_returned_unchanged(self, mock_local_client):
+        """Test that text without ESC bytes is returned as-is without a regex pass."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        text = "Health: 10/10\n@...#"
+        
+        with patch('src.bot._ANSI_RE') as ansi_re:
+            assert bot._clean_ansi(text) is text
+            ansi_re.sub.assert_not_called()
+
+
+class TestCleanLastScreen:
+    """Tests for the per-screen cache in DCSSBot._clean_last_screen."""
+    
+    def test_cleans_each_screen_once(self, mock_local_client):
+        """Test that repeated reads reuse the cleaned text until last_screen changes."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.last_screen = "\x1b[31mHealth: 5/9\x1b[0m"
+        
+        with patch('src.bot._strip_ansi', wraps=lambda text: text.replace('\x1b[31m', '').replace('\x1b[0m', '')) as strip:
+            assert bot._clean_last_screen() == "Health: 5/9"
+            bot._clean_ansi("\x1b[1mother text")
+            assert bot._clean_last_screen() == "Health: 5/9"
+            assert strip.call_count == 2  # last_screen once, the other text once
+            
+            bot.last_screen = "\x1b[31mHealth: 4/9\x1b[0m"
+            assert bot._clean_last_screen() == "Health: 4/9"
+        
+        bot.last_screen = ""
+        assert bot._clean_last_screen() == ""
+
+
+class TestParseScreenBuffer:
+    """Tests for the once-per-change parse in DCSSBot._parse_screen_buffer."""
+    
+    def test_parses_buffer_once_per_change(self, mock_local_client):
+        """Test that game state comes from the buffer and is parsed only when it changes."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.screen_buffer.update_from_output("Health: 7/9")
+        
+        with patch.object(bot.parser, 'parse_output', wraps=bot.parser.parse_output) as parse:
+            assert bot._parse_screen_buffer() == "Health: 7/9"
+            assert bot._parse_screen_buffer() == "Health: 7/9"
+            assert parse.call_count == 1
+            assert bot.parser.state.health == 7
+            
+            bot.screen_buffer.update_from_output("\rHealth: 5/9")
+            bot._parse_screen_buffer()
+            assert parse.call_count == 2
+            assert bot.parser.state.health == 5
+    
+    def test_decision_context_reuses_parse(self, mock_local_client):
+        """Test that building the decision context does not re-parse the screen just parsed."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.screen_buffer.update_from_output("Health: 7/9")
+        
+        with patch.object(bot.parser, 'parse_output', wraps=bot.parser.parse_output) as parse:
+            context = bot._prepare_decision_context(bot._parse_screen_buffer())
+            assert parse.call_count == 1
+            assert context.health == 7
+            
+            bot._prepare_decision_context("Health: 3/9")
+            assert parse.call_count == 2
+
+
+class TestLowerClean:
+    """Tests for the shared lower-cased screen in DCSSBot._lower_clean."""
+    
+    def test_helpers_share_one_lowered_screen(self, mock_local_client):
+        """Test that the detectors clean and lower the same screen only once."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        screen = "Pick up what? 2/52 slots\nCarrion\n a - rat corpse"
+        
+        with patch.object(bot, '_clean_ansi', wraps=bot._clean_ansi) as clean:
+            assert bot._is_item_pickup_menu(screen) is True
+            assert bot._detect_items_on_ground(screen) is False
+            bot._handle_item_pickup_menu(screen)
+            assert clean.call_count == 1
+        
+        assert bot._lower_clean("") == ""
+
+
+class TestScanEnemies:
+    """Tests for the per-screen enemy scan memo in DCSSBot._scan_enemies."""
+    
+    def test_same_screen_scanned_once(self, mock_local_client):
+        """Test that the enemy scan reruns only when a different screen object arrives."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        screen = "#..@..r#\n" + "\n" * 20 + "r   rat"
+        
+        with patch.object(bot, '_detect_enemy_in_range', return_value=(True, "rat")) as detect, \
+             patch.object(bot, '_calculate_direction_to_enemy', return_value='l') as direction:
+            assert bot._scan_enemies(screen) == (True, "rat", 'l')
+            assert bot._scan_enemies(screen) == (True, "rat", 'l')
+            assert detect.call_count == 1 and direction.call_count == 1
+            
+            bot._scan_enemies("".join(["#..@", "\n"]))
+            assert detect.call_count == 2
+    
+    @pytest.mark.parametrize("map_row, name, expected", [
+        ("#..@..r#", "rat", 'l'),
+        ("#r.@...#", "rat", 'h'),
+        ("#..@#\n#...r", "rat", 'n'),  # equal differences go diagonally
+        ("#@#\n#.#\n#r.", "rat", 'j'),  # the larger difference wins
+        ("#..@..r#", "at", None),  # the name must follow the symbol's spaces
+        ("#..@..r#", "r.t", None),  # names are matched literally, not as patterns
+    ])
+    def test_direction_to_enemy(self, mock_local_client, map_row, name, expected):
+        """Test that the enemy symbol is looked up from the monsters row of the named enemy."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        screen = map_row + "\n" * 22 + "r   rat\n" + "x   r.t"
+        
+        assert bot._calculate_direction_to_enemy(screen, name) == expected
+    
+    def test_helpers_share_one_split(self, mock_local_client):
+        """Test that the enemy helpers clean, split and extract the same screen only once."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        screen = "#..@..r#" + "\n" * 22 + "r   rat"
+        
+        with patch.object(bot, '_clean_ansi', wraps=bot._clean_ansi) as clean:
+            assert bot._scan_enemies(screen) == (True, "rat", 'l')
+            assert bot._extract_enemy_name(screen) == "rat"
+            assert clean.call_count == 1
+            
+            assert bot._extract_all_enemies_from_tui("g   goblin") == ["goblin"]
+            assert clean.call_count == 2
+
+
+    def test_monster_symbols_from_extraction(self, mock_local_client):
+        """Test that map symbols come from the same parse as the names, grouped entries included."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        screen = "#..@..g#" + "\n" * 30 + "gg  2 goblins\nr   rat"
+        
+        assert bot._extract_tui_monsters(screen) == [("g", "goblins"), ("r", "rat")]
+        assert bot._extract_all_enemies_from_tui(screen) == ["goblins", "rat"]
+        assert bot._find_direction_to_enemy(screen) == 'l'
+        assert bot.action_reason == "Moving toward g"
+        assert bot._extract_tui_monsters("") == []
+
+
+class TestDisplaySkip:
+    """Tests for skipping redundant redraws in DCSSBot._display_tui_to_user."""
+    
+    def test_unchanged_frame_not_redrawn(self, mock_local_client):
+        """Test that display() only runs again once the screen or activity changes."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.screen_buffer.update_from_output(GAMEPLAY_SCREEN)
+        
+        with patch.object(bot.unified_display, 'display') as display:
+            bot._display_tui_to_user("Exploring")
+            bot._display_tui_to_user("Exploring")
+            assert display.call_count == 1
+            
+            bot._log_activity("Found gold")
+            bot._display_tui_to_user("Exploring")
+            assert display.call_count == 2
+            
+            bot.screen_buffer.update_from_output("\x1b[1;1Hx")
+            bot._display_tui_to_user("Exploring")
+            assert display.call_count == 3
+    
+    def test_full_screen_display_forces_redraw(self, mock_local_client):
+        """Test that clearing the terminal in _display_screen makes the next unified frame redraw fully."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.screen_buffer.update_from_output(GAMEPLAY_SCREEN)
+        bot.unified_display._drawn_game_lines = ["old row"]
+        
+        with patch.object(bot, '_write_terminal'), patch.object(bot.unified_display, 'display') as display:
+            bot._display_tui_to_user("Exploring")
+            bot._display_screen("Game over screen", "Game Over!")
+            assert bot.unified_display._drawn_game_lines is None
+            bot._display_tui_to_user("Exploring")
+            assert display.call_count == 2
+
+
+class TestReadResponse:
+    """Tests for the adaptive settle time in DCSSBot._read_response."""
+    
+    def test_settle_time_shrinks_for_fast_responses(self, mock_local_client):
+        """Test that quick answers lower the stability threshold toward its floor."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.local_client.read_output_stable.return_value = "screen"
+        
+        thresholds = []
+        for _ in range(20):
+            bot._read_response()
+            thresholds.append(bot.local_client.read_output_stable.call_args.kwargs['stability_threshold'])
+        
+        assert thresholds[0] == 0.3
+        assert thresholds[-1] == 0.1
+        assert thresholds == sorted(thresholds, reverse=True)
+    
+    def test_empty_read_keeps_average(self, mock_local_client):
+        """Test that a timed-out read does not count as a response latency."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.local_client.read_output_stable.return_value = ""
+        
+        assert bot._read_response(timeout=0.5) == ""
+        assert bot.avg_response_ms == 600.0
+
+
+class TestItemsOnGround:
+    """Tests for the single-scan phrase checks in DCSSBot._detect_items_on_ground."""
+    
+    @pytest.mark.parametrize("output, expected", [
+        ("You see here a +1 hand axe.", True),
+        ("You see here a rat corpse.", False),
+        ("You see here 3 Sling Bullets.", False),
+        ("There are no items here.", False),
+        ("A kobold hits you.", False),
+    ])
+    def test_useful_item_detection(self, mock_local_client, output, expected):
+        """Test that only non-corpse, non-missile 'you see here' items trigger a grab."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        assert bot._detect_items_on_ground(output) is expected
+    
+    def test_layout_not_parsed_without_item_messages(self, mock_local_client):
+        """Test that the TUI layout is only parsed when an item phrase is on screen."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.last_screen = GAMEPLAY_SCREEN
+        bot.screen_buffer.update_from_output("#....@....#")
+        
+        with patch.object(bot, '_get_tui_areas', return_value={}) as get_areas:
+            bot._detect_items_on_ground("#....@....#")
+            get_areas.assert_not_called()
+            
+            bot.screen_buffer.update_from_output("\r\nYou see here a short sword.")
+            bot._detect_items_on_ground("You see here a short sword.")
+            get_areas.assert_called_once()
+    
+    def test_no_items_marks_failed_grab(self, mock_local_client):
+        """Test that 'nothing to pick up' records a failed grab attempt."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.move_count = 7
+        
+        assert bot._detect_items_on_ground("There is nothing to pick up here.") is False
+        assert bot.last_grab_failed is True
+        assert bot.last_grab_attempt == 7
+
+
+class TestSlotCommands:
+    """Tests that inventory commands carry their slot letter in a single action."""
+    
+    def test_quaff_includes_slot(self, mock_local_client):
+        """Test that identifying a potion sends 'q' and the slot as one command."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.parser.state.untested_potions = {'c': 'bubbly'}
+        
+        assert bot._identify_untested_potions() == 'qc'
+        assert "slot c" in bot.action_reason
+    
+    def test_no_untested_potions(self, mock_local_client):
+        """Test that nothing is quaffed when every potion is identified."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.parser.state.untested_potions = {}
+        
+        assert bot._identify_untested_potions() is None
+    
+    def test_potion_effect_from_message(self, mock_local_client):
+        """Test that quaff messages map to effects in table order, ignoring case and ANSI codes."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        assert bot._parse_potion_effect_from_message("\x1b[1mYou feel much better.") == ('unknown_color', 'healing')
+        assert bot._parse_potion_effect_from_message("You float gently upward.") == ('unknown_color', 'levitation')
+        assert bot._parse_potion_effect_from_message("Nothing appears to happen.") is None
+
+
+class TestWriteTerminal:
+    """Tests for the single-write terminal output in DCSSBot._write_terminal."""
+    
+    def test_frame_written_to_stdout_fd(self, mock_local_client):
+        """Test that a frame goes straight to stdout's descriptor in one piece."""
+        import os
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        read_fd, write_fd = os.pipe()
+        stdout = MagicMock()
+        stdout.fileno.return_value = write_fd
+        
+        try:
+            with patch('sys.stdout', stdout):
+                bot._display_screen("#..@\n│ok", "Move")
+            assert os.read(read_fd, 4096) == "\033[2J\033[H#..@\n│ok\n".encode('utf-8')
+            stdout.write.assert_not_called()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+    
+    def test_falls_back_without_descriptor(self, mock_local_client, capsys):
+        """Test that captured stdout (no fileno) still receives the frame."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        bot._display_screen_visual("Health: 9/9")
+        bot._display_screen_visual("Health: 9/9")  # identical frame is not redrawn
+        
+        assert capsys.readouterr().out == "\033[2J\033[HHealth: 9/9"
+    
+    def test_reset_terminal_single_write(self, mock_local_client):
+        """Test that the terminal reset goes out as one write of all four sequences."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        
+        with patch.object(bot, '_write_terminal') as write:
+            bot._reset_terminal()
+        
+        write.assert_called_once_with('\033[0m\033[?25h\033[H\033[2J')
+
+
+class TestQuitGame:
+    """Tests for the typed-quit fallbacks in DCSSBot._quit_game_gracefully."""
+    
+    @pytest.mark.parametrize("prompt", [
+        "Are you sure? Type quit to confirm",
+        "Something else entirely",
+        None,
+    ])
+    def test_quit_sent_in_one_write(self, mock_local_client, prompt):
+        """Test that 'quit' and enter go out as one write, with no fixed sleeps."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        client = bot.local_client
+        client.read_output_stable.side_effect = [None, prompt, None]
+        
+        with patch('src.bot.time.sleep') as sleep:
+            bot._quit_game_gracefully()
+        
+        sent = [call.args[0] for call in client.send_command.call_args_list]
+        assert sent == ['E', '\x11', 'quit\r']
+        sleep.assert_not_called()
+
+
+class TestPrintFinalStats:
+    """Tests for the end-of-game report in DCSSBot._print_final_stats."""
+    
+    def test_report_printed_once_and_logged_per_section(self, mock_local_client, capsys):
+        """Test that the report is one stdout write with blank lines between sections, one log record each."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.enemies_encountered = {"rat", "bat"}
+        bot.items_found = [f"item {i}" for i in range(12)]
+        bot.event_counts = {"gold": 2}
+        
+        with patch('builtins.print', wraps=print) as printed, patch('src.bot.logger') as log:
+            bot._print_final_stats()
+        
+        assert printed.call_count == 1
+        out = capsys.readouterr().out
+        assert out.startswith("=== Final Statistics ===\n")
+        assert "\n\nEnemies Encountered:\n  - bat\n  - rat\n\nItems Found:\n" in out
+        assert "  - item 9\n  ... and 2 more items\n\nEvent Log" in out
+        assert log.info.call_count == 6
+    
+    def test_captured_values_preferred_over_state(self, mock_local_client, capsys):
+        """Test that values captured before quitting win, and uncaptured ones fall back to the parser state."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.final_health, bot.final_max_health = 7, 20
+        bot.parser.state.mana, bot.parser.state.max_mana = 3, 5
+        bot.parser.state.health = 1
+        
+        bot._print_final_stats()
+        
+        out = capsys.readouterr().out
+        assert "Health: 7/20\n" in out
+        assert "Mana: 3/5\n" in out
+
+
+class TestSaveDebugScreenGate:
+    """Tests for the capture_all_screens gate on DCSSBot._save_debug_screen."""
+    
+    def test_disabled_capture_writes_nothing(self, mock_local_client):
+        """Test that no files are queued when screen capture is disabled."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.capture_all_screens = False
+        bot.debug_writer = MagicMock()
+        
+        assert bot._save_debug_screen("screen", "action") == ""
+        bot.debug_writer.write.assert_not_called()
+        assert bot.screen_counter == 0
+    
+    def test_capture_written_in_background(self, mock_local_client, tmp_path):
+        """Test that a capture and its index entry are written once the writer drains."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.capture_all_screens = True
+        bot.debug_screens_dir = str(tmp_path)
+        
+        assert bot._save_debug_screen("\x1b[31mHello\x1b[0m", "Move 1: Sending 'j'") == "0001_visual.txt"
+        bot._log_screen_and_action("\x1b[31mHello\x1b[0m", "Sending 'j'")
+        bot.debug_writer.flush()
+        
+        assert "│ Hello" in (tmp_path / "0001_clean.txt").read_text(encoding='utf-8')
+        assert (tmp_path / "0001_raw.txt").exists()
+        bot._close_log_files()
+        index = open(bot.screen_index_file).read()
+        assert "Move 1: Sending 'j'" in index
+        assert "SCREEN:\nHello\n" in open(bot.log_file).read()
+    
+    def test_full_queue_drops_capture(self, mock_local_client):
+        """Test that a capture is dropped, without using a screen number, when the writer is backed up."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.capture_all_screens = True
+        bot.debug_writer = MagicMock()
+        bot.debug_writer.offer.return_value = False
+        
+        assert bot._save_debug_screen("screen", "action") == ""
+        assert bot.screen_counter == 0
+
+
+
+class TestRunStartupFailure:
+    """Tests that DCSSBot.run() flushes its log files when startup fails."""
+    
+    def test_captures_written_after_failed_startup(self, mock_local_client, tmp_path):
+        """Test that screens captured during a failed startup are on disk once run() returns."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.capture_all_screens = True
+        bot.debug_screens_dir = str(tmp_path)
+        
+        def failed_startup():
+            for i in range(5):
+                bot._save_debug_screen(f"species menu {i}", f"Startup phase {i + 1}")
+            return False
+        
+        with patch.object(bot, '_local_startup', side_effect=failed_startup):
+            bot.run(max_steps=1)
+        
+        assert sorted(p.name for p in tmp_path.glob("*_visual.txt")) == [f"{i:04d}_visual.txt" for i in range(1, 6)]
+        assert bot._log_fp.closed and bot._index_fp.closed
+        bot.local_client.disconnect.assert_called_once()
+    
+    def test_files_closed_when_connect_fails(self, mock_local_client):
+        """Test that the session log and screen index are closed when the client cannot connect."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.local_client.connect.return_value = False
+        
+        bot.run(max_steps=1)
+        
+        assert bot._log_fp.closed and bot._index_fp.closed
+
+class TestSessionLog:
+    """Tests for the screen/action entries DCSSBot writes to the session log."""
+    
+    def test_entry_written_on_caller_thread(self, mock_local_client):
+        """Test that an entry is in the log file as soon as the call returns, without the background writer."""
+        from src.bot import DCSSBot
+        bot = DCSSBot()
+        bot.debug_writer = MagicMock()
+        
+        bot._log_screen_and_action("\x1b[31mHello\x1b[0m", "Sending 'j'")
+        
+        bot.debug_writer.submit.assert_not_called()
+        assert "Action: Sending 'j'\n" in open(bot.log_file).read()
+        assert "SCREEN:\nHello\n" in open(bot.log_file).read()
+        bot._close_log_files()
@@ -0,0 +1,48 @@
+"""Tests for the cached log timestamp helper."""
+
+import re
+import time
+import pytest
+from unittest.mock import patch
+from src.utils import clock
+
+
+@pytest.mark.unit
+class TestTimestampMs:
+    """Tests for src.utils.clock.timestamp_ms.
+    
+    Only the clock module's view of time is patched: other time.time() callers
+    (e.g. logging from finalizers run by the GC) must not consume the fake values.
+    """
+    
+    def test_format_matches_strftime(self):
+        """Test that the timestamp matches strftime's HH:MM:SS plus milliseconds."""
+        with patch('src.utils.clock.time', wraps=time) as fake_time:
+            fake_time.time.return_value = 1700000000.25
+            stamp = clock.timestamp_ms()
+        
+        expected = time.strftime("%H:%M:%S", time.localtime(1700000000)) + ".250"
+        assert stamp == expected
+        assert re.fullmatch(r'\d\d:\d\d:\d\d\.\d{3}', stamp)
+    
+    def test_strftime_once_per_second(self):
+        """Test that calls within the same second reuse the formatted seconds."""
+        with patch('src.utils.clock.time', wraps=time) as fake_time:
+            fake_time.time.side_effect = [1700000100.1, 1700000100.9, 1700000101.0]
+            first = clock.timestamp_ms()
+            second = clock.timestamp_ms()
+            third = clock.timestamp_ms()
+        
+        assert fake_time.strftime.call_count == 2
+        assert first[:8] == second[:8]
+        assert (first[-3:], second[-3:], third[-3:]) == ("100", "900", "000")
+    
+    def test_seconds_timestamp_shares_cache(self):
+        """Test that timestamp() truncates like strftime and reuses timestamp_ms()'s formatted second."""
+        with patch('src.utils.clock.time', wraps=time) as fake_time:
+            fake_time.time.side_effect = [1700000200.2, 1700000200.99]
+            with_ms = clock.timestamp_ms()
+            seconds = clock.timestamp()
+        
+        assert fake_time.strftime.call_count == 1
+        assert seconds == with_ms[:8] == time.strftime("%H:%M:%S", time.localtime(1700000200))
@@ -34,8 +34,6 @@ def create_test_context(**kwargs):
             self.health = 100
             self.max_health = 100
             self.items_on_ground = False
-            self.equip_slot_pending = False
-            self.quaff_slot_pending = False
             self.in_menu = False
             self.last_action_sent = ""
             self.last_level_up_processed = 0
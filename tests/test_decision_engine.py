@@ -34,7 +34,7 @@ class TestRule:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -57,7 +57,7 @@ class TestRule:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -76,7 +76,7 @@ class TestDecisionContext:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -91,13 +91,30 @@ class TestDecisionContext:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
             has_gameplay_indicators=True, gameplay_started=True, goto_state=None, goto_target_level=0
         )
         assert ctx.health_percentage == 100.0
+    
+    def test_context_uses_slots(self):
+        """Test that contexts store fields in slots, not a per-instance dict."""
+        ctx = DecisionContext(
+            output="", health=50, max_health=100, level=1, dungeon_level=1,
+            enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
+            enemy_direction=None,
+            in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
+            has_level_up=False,
+            has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
+            last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
+            last_equipment_check=0, last_inventory_refresh=0, move_count=0,
+            has_gameplay_indicators=True, gameplay_started=True, goto_state=None, goto_target_level=0
+        )
+        assert not hasattr(ctx, '__dict__')
+        with pytest.raises(AttributeError):
+            ctx.not_a_field = True
 
 
 class TestDecisionEngine:
@@ -141,7 +158,7 @@ class TestDecisionEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -165,7 +182,7 @@ class TestDecisionEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -176,6 +193,41 @@ class TestDecisionEngine:
         # CRITICAL should match first
         assert command == 'critical'
     
+    def test_equal_priority_keeps_insertion_order(self):
+        """Test that rules of equal priority are evaluated in the order added."""
+        engine = DecisionEngine()
+        engine.add_rule(Rule("first", Priority.NORMAL, lambda ctx: True, lambda ctx: ('a', 'a')))
+        engine.add_rule(Rule("urgent", Priority.URGENT, lambda ctx: True, lambda ctx: ('u', 'u')))
+        engine.add_rule(Rule("second", Priority.NORMAL, lambda ctx: True, lambda ctx: ('b', 'b')))
+        engine.add_rule(Rule("low", Priority.LOW, lambda ctx: True, lambda ctx: ('l', 'l')))
+        
+        assert [r.name for r in engine.rules] == ["first", "urgent", "second", "low"]
+        assert [r.name for r in engine._sorted_rules] == ["urgent", "first", "second", "low"]
+    
+    def test_disabled_rule_registered_but_not_evaluated(self):
+        """Test that a disabled rule is listed in rules but never has its condition called."""
+        engine = DecisionEngine()
+        calls = []
+        engine.add_rule(Rule("placeholder", Priority.CRITICAL, lambda ctx: calls.append(ctx) or True,
+                             lambda ctx: ('p', 'p'), enabled=False))
+        engine.add_rule(Rule("fallback", Priority.LOW, lambda ctx: True, lambda ctx: ('o', 'fallback')))
+        
+        ctx = DecisionContext(
+            output="", health=50, max_health=100, level=1, dungeon_level=1,
+            enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
+            enemy_direction=None,
+            in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
+            has_level_up=False,
+            has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
+            last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
+            last_equipment_check=0, last_inventory_refresh=0, move_count=0,
+            has_gameplay_indicators=True, gameplay_started=True, goto_state=None, goto_target_level=0
+        )
+        
+        assert [r.name for r in engine.rules] == ["placeholder", "fallback"]
+        assert engine.decide(ctx) == ('o', 'fallback')
+        assert calls == []
+    
     def test_decide_no_matching_rules(self):
         """Test that decide handles no matching rules gracefully."""
         engine = DecisionEngine()
@@ -186,7 +238,7 @@ class TestDecisionEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -213,7 +265,7 @@ class TestDefaultEngine:
             enemy_detected=True, enemy_name="goblin", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -231,7 +283,7 @@ class TestDefaultEngine:
             enemy_detected=True, enemy_name="bat", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -252,7 +304,7 @@ class TestDefaultEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -269,7 +321,7 @@ class TestDefaultEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -286,7 +338,7 @@ class TestDefaultEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=True,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -303,7 +355,7 @@ class TestDefaultEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=True, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -320,7 +372,7 @@ class TestDefaultEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=True, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=1,  # New level
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -337,7 +389,7 @@ class TestDefaultEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -354,7 +406,7 @@ class TestDefaultEngine:
             enemy_detected=False, enemy_name="", items_on_ground=False, in_shop=False,
             enemy_direction=None,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
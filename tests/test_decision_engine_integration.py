@@ -19,8 +19,8 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=True,  # ← Menu prompt (CRITICAL priority)
-            quaff_slot_pending=False, has_level_up=False, has_more_prompt=False,
+            has_level_up=False,
+            has_more_prompt=True,  # ← Menu prompt (CRITICAL priority)
             attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -28,9 +28,8 @@ class TestDecisionEngineIntegration:
         )
         
         command, reason = engine.decide(ctx)
-        # Should be empty (handled by bot with stored slot), not combat
-        # Engine returns empty string for pending prompts
-        assert "equip" in reason.lower() or command == ""
+        # Should dismiss the prompt, not attack
+        assert command == ' '
     
     def test_shop_exit_before_exploration(self):
         """Test that shop exit happens before exploration."""
@@ -42,7 +41,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=True,  # ← Shop detected
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -65,7 +64,6 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False,
             has_level_up=True, has_more_prompt=True,  # Both set
             attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=1,  # New level (2 > 1)
@@ -91,7 +89,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -110,7 +108,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent='\t',  # ← Just sent autofight
             last_level_up_processed=0, last_attribute_increase_level=0,
@@ -128,7 +126,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent=".", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -150,7 +148,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -167,7 +165,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -184,7 +182,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -206,7 +204,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=True,  # Items available
             in_shop=False, in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=True,  # ← More prompt (CRITICAL)
             attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
@@ -227,7 +225,7 @@ class TestDecisionEngineIntegration:
             enemy_detected=True, enemy_name="goblin", enemy_direction=None,  # Enemy present (would normally fight)
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False,
             save_game_prompt=True,  # ← Save game prompt (CRITICAL - takes priority)
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
@@ -250,7 +248,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -268,7 +266,7 @@ class TestDecisionEngineIntegration:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -295,7 +293,7 @@ class TestDecisionEngineWithRealGameStates:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=0,
@@ -315,7 +313,7 @@ class TestDecisionEngineWithRealGameStates:
             enemy_direction=None,
             items_on_ground=False, in_shop=False,
             in_inventory_screen=False, in_item_pickup_menu=False, in_menu=False,
-            equip_slot_pending=False, quaff_slot_pending=False, has_level_up=False,
+            has_level_up=False,
             has_more_prompt=False, attribute_increase_prompt=False, save_game_prompt=False,
             last_action_sent="", last_level_up_processed=0, last_attribute_increase_level=0,
             last_equipment_check=0, last_inventory_refresh=0, move_count=50,
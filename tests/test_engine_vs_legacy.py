@@ -71,8 +71,6 @@ class TestEngineVsLegacy:
             'in_inventory_screen': False,
             'in_item_pickup_menu': False,
             'in_menu': False,
-            'equip_slot_pending': False,
-            'quaff_slot_pending': False,
             'has_level_up': False,
             'has_more_prompt': False,
             'attribute_increase_prompt': False,
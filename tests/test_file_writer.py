@@ -0,0 +1,70 @@
+"""Tests for the background debug file writer."""
+
+import pytest
+from src.utils.file_writer import BackgroundFileWriter
+
+
+@pytest.mark.unit
+class TestBackgroundFileWriter:
+    """Tests for BackgroundFileWriter ordering and flushing."""
+    
+    def test_no_thread_until_first_write(self):
+        """Test that constructing a writer does not start a thread."""
+        writer = BackgroundFileWriter()
+        assert writer._thread is None
+        writer.close()
+    
+    def test_writes_and_appends_in_order(self, tmp_path):
+        """Test that queued writes land in submission order after close()."""
+        writer = BackgroundFileWriter()
+        path = tmp_path / "out.txt"
+        
+        writer.write(str(path), "first\n")
+        for i in range(50):
+            writer.write(str(path), f"line {i}\n", mode='a')
+        writer.close()
+        
+        lines = path.read_text().splitlines()
+        assert lines[0] == "first"
+        assert lines[1:] == [f"line {i}" for i in range(50)]
+    
+    def test_flush_waits_for_pending_writes(self, tmp_path):
+        """Test that flush() returns only once files are written."""
+        writer = BackgroundFileWriter()
+        path = tmp_path / "screen.txt"
+        
+        writer.write(str(path), "│ box │\n")
+        writer.flush()
+        
+        assert path.read_text(encoding='utf-8') == "│ box │\n"
+        writer.close()
+    
+    def test_submit_runs_jobs_in_order(self):
+        """Test that submitted jobs run in order alongside writes, and errors don't stop the worker."""
+        writer = BackgroundFileWriter()
+        calls = []
+        
+        writer.submit(calls.append, 1)
+        writer.submit(lambda: 1 / 0)
+        writer.submit(calls.append, 2)
+        writer.close()
+        
+        assert calls == [1, 2]
+    
+    def test_offer_drops_when_queue_full(self):
+        """Test that offer() drops jobs once maxsize are pending, while submit() still queues."""
+        import threading
+        writer = BackgroundFileWriter(maxsize=1)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+        
+        writer.submit(lambda: (started.set(), release.wait()))
+        assert started.wait(2)
+        assert writer.offer(calls.append, 1) is True
+        assert writer.offer(calls.append, 2) is False
+        writer.submit(calls.append, 3)  # submit() is never bounded, so this must not block
+        release.set()
+        writer.close()
+        
+        assert calls == [1, 3]
+
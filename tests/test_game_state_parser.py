@@ -35,6 +35,16 @@ class TestGameStateParser:
         # Should not crash with ANSI codes present
         assert state is not None
 
+    def test_clean_ansi_strips_and_passes_plain_text(self, game_state_parser):
+        """Test that escapes are removed and escape-free text is returned unchanged."""
+        assert game_state_parser._clean_ansi("\x1b[32mHello\x1b[0m \x1b(BWorld") == "Hello World"
+        
+        plain = "Health: 10/10"
+        assert game_state_parser._clean_ansi(plain) is plain
+        
+        # Sequences ending in a non-letter final byte stop there, not at the next letter
+        assert game_state_parser._clean_ansi("\x1b[2~Health: 5/9") == "Health: 5/9"
+
     def test_visible_text_extraction(self, game_state_parser):
         """Test extraction of visible text from output."""
         output = "Health: 100/100\nMana: 50/50"
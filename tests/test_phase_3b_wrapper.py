@@ -23,11 +23,11 @@ class TestDecisionEngineIntegration:
             assert bot.decision_engine is not None
             assert len(bot.decision_engine.rules) > 0
     
-    def test_engine_has_25_rules(self):
+    def test_engine_has_23_rules(self):
         """Verify engine has expected number of rules."""
         with patch('src.local_client.LocalCrawlClient'):
             bot = DCSSBot()
-            assert len(bot.decision_engine.rules) >= 25
+            assert len(bot.decision_engine.rules) >= 23
     
     def test_decide_action_uses_engine_directly(self):
         """Verify _decide_action uses engine directly."""
@@ -54,12 +54,11 @@ class TestDecisionEngineIntegration:
             mock_context = MagicMock()
             with patch.object(bot, '_prepare_decision_context', return_value=mock_context):
                 with patch.object(bot.decision_engine, 'decide', return_value=('\t', 'autofight')):
-                    with patch.object(bot, '_return_action', return_value='\t') as mock_return:
-                        result = bot._decide_action("test output")
-                        
-                        mock_return.assert_called_once_with('\t', 'autofight')
-                        assert result == '\t'
-                        assert bot.engine_decisions_made == 1
+                    result = bot._decide_action("test output")
+                    
+                    assert result == '\t'
+                    assert bot.action_reason == 'autofight'
+                    assert bot.engine_decisions_made == 1
     
     def test_engine_decisions_counter_increments(self):
         """Verify engine decisions counter increments."""
@@ -115,7 +114,7 @@ class TestEngineRuleOrdering:
         engine = create_default_engine()
         
         critical_rules = [r for r in engine.rules if r.priority == Priority.CRITICAL]
-        assert len(critical_rules) >= 5
+        assert len(critical_rules) >= 4
     
     def test_all_priority_levels_present(self):
         """Verify all priority levels are represented."""
@@ -166,8 +165,6 @@ class TestPrepareDecisionContext:
             in_inventory_screen=False,
             in_item_pickup_menu=False,
             in_menu=False,
-            equip_slot_pending=False,
-            quaff_slot_pending=False,
             has_level_up=False,
             has_more_prompt=False,
             attribute_increase_prompt=False,
@@ -208,8 +205,6 @@ class TestEngineDecisionQuality:
             in_inventory_screen=False,
             in_item_pickup_menu=False,
             in_menu=False,
-            equip_slot_pending=False,
-            quaff_slot_pending=False,
             has_level_up=False,
             has_more_prompt=False,
             attribute_increase_prompt=False,
@@ -247,8 +242,6 @@ class TestEngineDecisionQuality:
             in_inventory_screen=False,
             in_item_pickup_menu=False,
             in_menu=False,
-            equip_slot_pending=False,
-            quaff_slot_pending=False,
             has_level_up=False,
             has_more_prompt=False,
             attribute_increase_prompt=False,
@@ -153,6 +153,19 @@ class TestScreenParsing:
         
         assert detected is True, "Should detect enemy with grouped lowercase goblins"
         assert enemy_name == "goblins", f"Expected enemy name 'goblins', got '{enemy_name}'"
+    
+    def test_grouped_entry_wins_over_map_letter(self):
+        """Test that a monster glyph at the map's right edge does not swallow a grouped entry.
+        
+        The standard pattern could match "x   gg  2 goblins" as one creature named
+        "gg  2 goblins", so a line with any grouped entry is never read as standard entries.
+        """
+        bot = DCSSBot()
+        
+        line = "│#..x   gg  2 goblins (1 wandering)                 │"
+        
+        assert bot._extract_all_enemies_from_tui(line) == ["goblins"]
+    
     def test_message_artifacts_not_detected_as_enemies(self):
         """Test that message artifacts like 'Found 19 sling bullets' are not detected as monsters."""
         bot = DCSSBot()
@@ -189,7 +202,7 @@ class TestScreenParsing:
         """Test that 'you have X gold' inventory messages are not detected as enemies.
         
         Regression test for issue where bot run detected "have (9x) -> gold" as enemy
-        and attempted autofight. The word "have" must be in invalid_symbols to prevent
+        and attempted autofight. The word "have" must be in _NON_MONSTER_WORDS to prevent
         this pattern from matching as a grouped creature entry.
         """
         bot = DCSSBot()
@@ -213,7 +226,7 @@ class TestScreenParsing:
         "Nothing quivered" appears in the equipment/inventory section of the TUI
         (e.g., "a) +0 war axe" followed by "Nothing quivered"), not in the monsters
         section. This should not be detected as an enemy. The word "Nothing" must be
-        in invalid_symbols and "quivered" must be in item_keywords filter.
+        in _NON_MONSTER_WORDS and "quivered" must be in _NON_MONSTER_ITEM_WORDS.
         """
         bot = DCSSBot()
         
@@ -71,6 +71,21 @@ class TestCharCreationStateMachineV2:
         state_machine.reset()
         assert state_machine.current_state == state_machine.startup
         assert len(state_machine.state_history) == 1
+    
+    def test_transition_pattern_logic(self):
+        """Test OR/AND matching and case handling of the precompiled patterns."""
+        from src.state_machines.char_creation_state_machine import MenuTransitionPattern
+        any_of = MenuTransitionPattern(["Choose.*Race", "which.*class"], is_regex=True)
+        assert any_of.matches("Please CHOOSE your race")
+        assert not any_of.matches("choose a background")
+        
+        all_of = MenuTransitionPattern([r"hp:\s+\d+/\d+", r"ac:\s+\d+"], is_regex=True, match_all=True)
+        assert all_of.matches("HP: 10/10  AC: 3")
+        assert not all_of.matches("HP: 10/10")
+        
+        exact = MenuTransitionPattern(["Tutorial"], case_sensitive=True)
+        assert exact.matches("Tutorial mode")
+        assert not exact.matches("tutorial mode")
 
 
 @pytest.mark.unit
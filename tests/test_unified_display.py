@@ -0,0 +1,130 @@
+"""Tests for the unified game screen + activity panel display."""
+
+import pytest
+from unittest.mock import patch
+from src.display.bot_unified_display import UnifiedBotDisplay
+
+
+@pytest.mark.unit
+class TestAddActivity:
+    """Tests for UnifiedBotDisplay.add_activity formatting."""
+    
+    @pytest.mark.parametrize("level,prefix", [
+        ("success", "✓"),
+        ("warning", "⚠"),
+        ("error", "✗"),
+        ("debug", "⚙"),
+        ("info", "ℹ"),
+        ("unknown", "ℹ"),
+    ])
+    def test_level_prefix(self, level, prefix):
+        """Test that each level gets its indicator, with unknown levels shown as info."""
+        display = UnifiedBotDisplay()
+        with patch('src.display.bot_unified_display.timestamp', return_value="12:34:56"):
+            display.add_activity("Moved", level)
+        
+        assert display.get_activity_history() == [f"[12:34:56] {prefix} Moved"]
+        assert display.activity_version == 1
+
+
+@pytest.mark.unit
+class TestActivityPanel:
+    """Tests for the activity panel renderers."""
+    
+    def test_panel_written_in_one_call(self):
+        """Test that the panel goes out as one write, padded to the panel height."""
+        display = UnifiedBotDisplay()
+        display.add_activity("Explored", "info")
+        display.add_activity("Killed rat", "success")
+        
+        with patch('src.display.bot_unified_display.sys.stdout') as stdout:
+            display._display_activity_panel()
+        
+        stdout.write.assert_called_once()
+        lines = stdout.write.call_args[0][0].split("\n")
+        assert "BOT ACTIVITY (2 messages)" in lines[0]
+        assert len(lines) == UnifiedBotDisplay.ACTIVITY_PANEL_HEIGHT + 1  # Trailing newline
+        assert "Explored" in lines[-4]
+        assert lines[-3].startswith("\033[32m") and "Killed rat" in lines[-3]
+        assert lines[-2] == "-" * 120 + "\033[K"
+    
+    def test_activity_only_written_in_one_call(self):
+        """Test that the activity-only view clears, draws in one write and forces a full redraw next."""
+        display = UnifiedBotDisplay()
+        display._drawn_game_lines = ["row"]
+        display.add_activity("Low health", "warning")
+        
+        with patch('src.display.bot_unified_display.sys.stdout') as stdout:
+            display.display_activity_only()
+        
+        stdout.write.assert_called_once()
+        text = stdout.write.call_args[0][0]
+        assert text.startswith("\033[2J\033[H")
+        assert "\033[33m" in text and "Low health" in text
+        assert display._drawn_game_lines is None
+    
+    def test_long_message_truncated_once_keeping_color_reset(self):
+        """Test that long panel lines are cut in the text and still reset their color."""
+        display = UnifiedBotDisplay()
+        display.add_activity("x" * 200, "error")
+        
+        plain, panel_msg, colored_msg = display.activity_messages[0]
+        assert panel_msg.startswith("\033[31m") and panel_msg.endswith("...\033[0m")
+        assert len(panel_msg) == len("\033[31m") + 118 + len("\033[0m")
+        assert colored_msg == f"\033[31m{plain}\033[0m"
+        assert display.get_activity_history() == [plain]
+    
+    def test_recent_messages_tail_in_order(self):
+        """Test that the renderers' tail keeps the newest entries, oldest first."""
+        display = UnifiedBotDisplay(max_messages=100)
+        for i in range(40):
+            display.add_activity(f"msg {i}")
+        
+        recent = display._recent_messages(UnifiedBotDisplay.ACTIVITY_PANEL_HEIGHT - 3)
+        assert [plain.split()[-1] for plain, _, _ in recent] == [str(i) for i in range(31, 40)]
+        assert len(display._recent_messages(500)) == 40
+
+
+@pytest.mark.unit
+class TestGameRedraw:
+    """Tests for how display() redraws the game area between frames."""
+    
+    SCREEN = "row 0\nrow 1\nrow 2"
+    CHANGED = "row 0\nrow X\nrow 2"
+    
+    def _game_writes(self, display, screen):
+        """Strings written for the game area of one frame, without the activity panel."""
+        with patch('src.display.bot_unified_display.sys.stdout') as stdout, \
+             patch.object(display, '_display_activity_panel'):
+            display.display(screen)
+        return [c[0][0] for c in stdout.write.call_args_list]
+    
+    def test_owned_terminal_rewrites_only_changed_rows(self):
+        """Test that a display owning its terminal rewrites just the rows that changed."""
+        display = UnifiedBotDisplay(owns_terminal=True)
+        self._game_writes(display, self.SCREEN)
+        
+        writes = self._game_writes(display, self.CHANGED)
+        
+        assert not any("\033[2J" in w for w in writes)
+        assert "\033[2;1H\033[0mrow X\033[K" in writes
+        assert not any("row 0" in w or "row 2" in w for w in writes)
+    
+    def test_shared_terminal_clears_every_frame(self):
+        """Test that log output sharing the terminal cannot linger: every frame is a full redraw."""
+        display = UnifiedBotDisplay(owns_terminal=False)
+        self._game_writes(display, self.SCREEN)
+        
+        writes = self._game_writes(display, self.CHANGED)
+        
+        assert writes[0] == "\033[2J\033[H"
+        assert self.CHANGED in writes
+    
+    @pytest.mark.parametrize("stderr_tty,owns", [(True, False), (False, True)])
+    def test_ownership_follows_stderr(self, stderr_tty, owns):
+        """Test that the display only claims the terminal when stderr is not a terminal."""
+        with patch('src.display.bot_unified_display.sys.stderr') as stderr:
+            stderr.isatty.return_value = stderr_tty
+            display = UnifiedBotDisplay()
+        
+        assert display.owns_terminal is owns